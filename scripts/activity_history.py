@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Repository Activity History Store
+Keeps compact per-repository metric snapshots in SQLite so activity scoring can
+use star, fork and commit trends without extra API calls
+"""
+
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+
+DEFAULT_DB_PATH = (
+    Path(__file__).resolve().parent.parent / ".cache" / "activity_history.sqlite"
+)
+DEFAULT_WINDOW_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    repo TEXT NOT NULL,
+    date TEXT NOT NULL,
+    stars INTEGER NOT NULL,
+    forks INTEGER NOT NULL,
+    open_issues INTEGER NOT NULL,
+    recent_commits INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (repo, date)
+) WITHOUT ROWID;
+"""
+
+# For each repository, compare the latest snapshot in the window with the
+# earliest one in the same window. {repo_filter} is empty for all repositories,
+# or narrows the scan to one repository's (repo, date) primary key range.
+TRENDS_QUERY = """
+WITH windowed AS (
+    SELECT
+        repo,
+        date,
+        stars,
+        forks,
+        recent_commits,
+        FIRST_VALUE(date) OVER w AS first_date,
+        FIRST_VALUE(stars) OVER w AS first_stars,
+        FIRST_VALUE(forks) OVER w AS first_forks,
+        FIRST_VALUE(recent_commits) OVER w AS first_commits,
+        COUNT(*) OVER w AS snapshots,
+        ROW_NUMBER() OVER (PARTITION BY repo ORDER BY date DESC) AS recency
+    FROM snapshots
+    WHERE date BETWEEN :start AND :end {repo_filter}
+    WINDOW w AS (
+        PARTITION BY repo ORDER BY date
+        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+    )
+)
+SELECT
+    repo,
+    julianday(date) - julianday(first_date) AS days,
+    stars - first_stars AS star_delta,
+    forks - first_forks AS fork_delta,
+    recent_commits - first_commits AS commit_trend,
+    snapshots
+FROM windowed
+WHERE recency = 1
+"""
+
+
+class ActivityHistory:
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(db_path))
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def record_snapshot(self, repo, metrics, snapshot_date=None):
+        """Store today's metrics for a repository, replacing any earlier snapshot of the day"""
+        snapshot_date = snapshot_date or date.today()
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO snapshots "
+                "(repo, date, stars, forks, open_issues, recent_commits, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    repo,
+                    snapshot_date.isoformat(),
+                    metrics.get("stars") or 0,
+                    metrics.get("forks") or 0,
+                    metrics.get("open_issues") or 0,
+                    metrics.get("recent_commits") or 0,
+                    metrics.get("size") or 0,
+                ),
+            )
+
+    def get_trends(self, repo=None, window_days=DEFAULT_WINDOW_DAYS, as_of=None):
+        """Return star/fork velocity (per day) and commit trend per repository"""
+        as_of = as_of or date.today()
+        params = {
+            "start": (as_of - timedelta(days=window_days)).isoformat(),
+            "end": as_of.isoformat(),
+            "repo": repo,
+        }
+
+        # A literal predicate rather than ":repo IS NULL OR ...", which would stop
+        # SQLite from using the primary key
+        query = TRENDS_QUERY.format(repo_filter="AND repo = :repo" if repo else "")
+
+        trends = {}
+        for row in self.connection.execute(query, params):
+            name, days, star_delta, fork_delta, commit_trend, snapshots = row
+            trends[name] = {
+                "days": days,
+                "star_velocity": star_delta / days if days > 0 else 0.0,
+                "fork_velocity": fork_delta / days if days > 0 else 0.0,
+                "commit_trend": commit_trend,
+                "snapshots": snapshots,
+            }
+        return trends
+
+    def count_snapshots(self):
+        return self.connection.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
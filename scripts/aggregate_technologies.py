@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Technology Aggregation Index
+Builds account-wide language and topic statistics from repository analyses,
+updating incrementally from the previous run's snapshot
+"""
+
+import json
+from collections import Counter
+from itertools import combinations
+from pathlib import Path
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_PATH = (
+    Path(__file__).resolve().parent.parent / ".cache" / "technologies_snapshot.json"
+)
+
+# Separates the two technologies of a co-occurrence pair in snapshot keys
+PAIR_SEPARATOR = "\t"
+
+
+def repo_contribution(analysis):
+    """Extract the part of an analysis the aggregate index depends on"""
+    languages = {
+        lang: int(size) for lang, size in (analysis["languages"] or {}).items()
+    }
+    topics = sorted(set(analysis["topics"] or []))
+    return {
+        "fingerprint": json.dumps(
+            [analysis.get("pushed_at"), languages, topics], sort_keys=True
+        ),
+        "languages": languages,
+        "topics": topics,
+    }
+
+
+class TechnologyIndex:
+    def __init__(self, snapshot_path=DEFAULT_SNAPSHOT_PATH):
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.repos = {}
+        self.language_bytes = Counter()
+        self.language_repos = Counter()
+        self.topic_repos = Counter()
+        self.co_occurrence = Counter()
+        self._load_snapshot()
+
+    def _load_snapshot(self):
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return
+        try:
+            with open(self.snapshot_path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            print(f"Ignoring unreadable technology snapshot: {self.snapshot_path}")
+            return
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return
+
+        self.repos = snapshot["repos"]
+        totals = snapshot["totals"]
+        self.language_bytes = Counter(totals["language_bytes"])
+        self.language_repos = Counter(totals["language_repos"])
+        self.topic_repos = Counter(totals["topic_repos"])
+        self.co_occurrence = Counter(
+            {
+                tuple(pair.split(PAIR_SEPARATOR)): count
+                for pair, count in totals["co_occurrence"].items()
+            }
+        )
+
+    def save_snapshot(self):
+        if not self.snapshot_path:
+            return
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "repos": self.repos,
+            "totals": {
+                "language_bytes": dict(self.language_bytes),
+                "language_repos": dict(self.language_repos),
+                "topic_repos": dict(self.topic_repos),
+                "co_occurrence": {
+                    PAIR_SEPARATOR.join(pair): count
+                    for pair, count in self.co_occurrence.items()
+                },
+            },
+        }
+        with open(self.snapshot_path, "w") as f:
+            json.dump(snapshot, f)
+
+    @staticmethod
+    def _adjust(counter, key, amount):
+        counter[key] += amount
+        if counter[key] <= 0:
+            del counter[key]
+
+    def _apply(self, contribution, sign):
+        """Add (sign=1) or remove (sign=-1) one repository's contribution"""
+        for lang, size in contribution["languages"].items():
+            self._adjust(self.language_bytes, lang, sign * size)
+            self._adjust(self.language_repos, lang, sign)
+        for topic in contribution["topics"]:
+            self._adjust(self.topic_repos, topic, sign)
+
+        technologies = sorted(
+            set(contribution["languages"]) | set(contribution["topics"])
+        )
+        for pair in combinations(technologies, 2):
+            self._adjust(self.co_occurrence, pair, sign)
+
+    def update(self, analyses, prune=True):
+        """Fold a run's analyses into the index
+
+        Repositories whose languages, topics and push date are unchanged since
+        the snapshot are skipped. With prune, repositories missing from analyses
+        are removed. Returns the number of repositories added, changed and removed.
+        """
+        added = changed = removed = 0
+        seen = set()
+
+        for analysis in analyses:
+            name = analysis["full_name"]
+            seen.add(name)
+            contribution = repo_contribution(analysis)
+            previous = self.repos.get(name)
+
+            if previous and previous["fingerprint"] == contribution["fingerprint"]:
+                continue
+            if previous:
+                self._apply(previous, -1)
+                changed += 1
+            else:
+                added += 1
+
+            self._apply(contribution, 1)
+            self.repos[name] = contribution
+
+        if prune:
+            for name in set(self.repos) - seen:
+                self._apply(self.repos.pop(name), -1)
+                removed += 1
+
+        return added, changed, removed
+
+    def generate_data(self):
+        """Build the technologies data file contents"""
+        total_bytes = sum(self.language_bytes.values())
+
+        languages = [
+            {
+                "name": lang,
+                "bytes": size,
+                "percentage": round(size / total_bytes * 100, 1) if total_bytes else 0,
+                "repos": self.language_repos[lang],
+            }
+            for lang, size in sorted(
+                self.language_bytes.items(), key=lambda x: (-x[1], x[0])
+            )
+        ]
+        topics = [
+            {"name": topic, "repos": count}
+            for topic, count in sorted(
+                self.topic_repos.items(), key=lambda x: (-x[1], x[0])
+            )
+        ]
+        co_occurrence = [
+            {"technologies": list(pair), "repos": count}
+            for pair, count in sorted(
+                self.co_occurrence.items(), key=lambda x: (-x[1], x[0])
+            )
+        ]
+
+        return {
+            "repo_count": len(self.repos),
+            "total_bytes": total_bytes,
+            "languages": languages,
+            "topics": topics,
+            "co_occurrence": co_occurrence,
+        }
+
+    def save_data(self, data_path):
+        """Save the technologies index as a Jekyll data file"""
+        data_path = Path(data_path)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(data_path, "w") as f:
+            json.dump(self.generate_data(), f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        return data_path
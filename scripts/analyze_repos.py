@@ -5,6 +5,7 @@ Analyzes public repositories and generates project pages
 """
 
 import argparse
+import json
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -12,11 +13,59 @@ from pathlib import Path
 import requests
 import yaml
 
+from activity_history import DEFAULT_DB_PATH, ActivityHistory
+from aggregate_technologies import DEFAULT_SNAPSHOT_PATH, TechnologyIndex
+
+# Activity levels in display order:
+# (level, emoji, section heading, status label, statistics label)
+ACTIVITY_LEVELS = [
+    ("very_active", "🔥", "Very Active Projects", "Very Active", "Very Active"),
+    ("active", "⚡", "Active Projects", "Active", "Active"),
+    ("moderate", "📈", "Moderate Activity", "Moderate", "Moderate"),
+    ("low", "📉", "Low Activity", "Low", "Low Activity"),
+    ("idle", "😴", "Idle Projects", "Idle", "Idle"),
+    ("archived", "📦", "Archived Projects", "Archived", "Archived"),
+]
+ACTIVITY_EMOJI = {level: emoji for level, emoji, *_ in ACTIVITY_LEVELS}
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+DATA_DIR = Path(__file__).resolve().parent.parent / "docs" / "_data"
+
+# GitHub REST requests made by analyze_repository() for every repository
+REQUESTS_PER_REPO = {"languages": 1, "commits": 1, "readme": 1}
+LISTING_PAGE_SIZE = 100
+
+# Snapshots must span at least this many days before trends add to the score
+MIN_TREND_DAYS = 7
+TREND_WINDOW_DAYS = 30
+
+# libyaml's C emitter when available. It matches yaml.Dumper byte for byte for
+# printable ASCII strings, but folds long escaped (double-quoted) strings differently
+YAML_C_DUMPER = getattr(yaml, "CDumper", None)
+
+# Project page templates, bound once at import time
+render_project_header = (
+    "## {title}\n\n"
+    "{description}\n\n"
+    "**Status:** {emoji} {status}\n\n"
+    "## Project Stats\n\n"
+    "- **Stars:** {stars}\n"
+    "- **Forks:** {forks}\n"
+    "- **Language:** {language}\n"
+).format
+render_license_line = "- **License:** {}\n".format
+render_dates = "- **Created:** {created}\n- **Last Updated:** {updated}\n".format
+render_language_line = "- **{}:** {}%\n".format
+render_topic = "`{}` ".format
+render_links = "\n## Links\n\n- [View on GitHub]({})\n".format
+render_live_demo = "- [Live Demo]({})\n".format
+
 
 class GitHubRepoAnalyzer:
-    def __init__(self, username, token=None):
+    def __init__(self, username, token=None, history=None):
         self.username = username
         self.token = token
+        self.history = history
         self.session = requests.Session()
 
         if token:
@@ -31,7 +80,7 @@ class GitHubRepoAnalyzer:
         """Fetch all public repositories for the user"""
         repos = []
         page = 1
-        per_page = 100
+        per_page = LISTING_PAGE_SIZE
 
         while True:
             url = f"https://api.github.com/users/{self.username}/repos"
@@ -68,6 +117,88 @@ class GitHubRepoAnalyzer:
 
         return repos
 
+    def save_repository_listing(self, repos, path):
+        """Cache a repository listing so later runs and plans can skip fetching it"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(repos, f)
+        return path
+
+    def load_repository_listing(self, path):
+        """Load a cached repository listing"""
+        with open(path) as f:
+            return json.load(f)
+
+    def get_rate_limit(self):
+        """Fetch the core API rate limit (this request does not count against it)"""
+        response = self.session.get("https://api.github.com/rate_limit")
+        response.raise_for_status()
+        core = response.json()["resources"]["core"]
+        return {
+            "limit": core["limit"],
+            "remaining": core["remaining"],
+            "reset": core["reset"],
+        }
+
+    def estimate_requests(self, repo_count, listing_cached=False, listing_count=None):
+        """Estimate API requests per endpoint for analyzing repo_count repositories
+
+        listing_count is the size of the full listing when the run analyzes fewer
+        repositories (--limit); the whole listing is still fetched.
+        """
+        listing_count = repo_count if listing_count is None else listing_count
+        # Listing stops at the first short page, so a full last page costs one more
+        listing_pages = 0 if listing_cached else listing_count // LISTING_PAGE_SIZE + 1
+
+        estimate = {"repos": listing_pages}
+        for endpoint, count in REQUESTS_PER_REPO.items():
+            estimate[endpoint] = count * repo_count
+        return estimate
+
+    def build_execution_plan(
+        self, repos, rate_limit, listing_cached=False, reserve=0, listing_count=None
+    ):
+        """Order the run's requests and find where they exceed the rate-limit budget
+
+        Repositories are counted in the order the run analyzes them. Those past
+        the remaining budget (less a reserve) are the ones a run started now would
+        not reach before the limit is exhausted. A run cannot resume from there,
+        so the full run should wait for the reset instead.
+        """
+        estimate = self.estimate_requests(len(repos), listing_cached, listing_count)
+        budget = rate_limit["remaining"] - reserve
+        per_repo = sum(REQUESTS_PER_REPO.values())
+
+        used = estimate["repos"]
+        steps = [{"step": "list repositories", "requests": used, "cumulative": used}]
+        fits = 0
+        for repo in repos:
+            used += per_repo
+            steps.append(
+                {
+                    "step": f"analyze {repo['name']}",
+                    "requests": per_repo,
+                    "cumulative": used,
+                }
+            )
+            if used <= budget:
+                fits += 1
+
+        total = sum(estimate.values())
+        return {
+            "repositories": len(repos),
+            "listing_cached": listing_cached,
+            "requests_by_endpoint": estimate,
+            "total_requests": total,
+            "rate_limit": rate_limit,
+            "reserve": reserve,
+            "fits_in_budget": total <= budget,
+            "repositories_in_budget": fits,
+            "over_budget_repositories": [repo["name"] for repo in repos[fits:]],
+            "steps": steps,
+        }
+
     def analyze_repository(self, repo):
         """Analyze a single repository and extract key information"""
         # Get additional repository details (not used but kept for future use)
@@ -89,8 +220,24 @@ class GitHubRepoAnalyzer:
             commits_response.json() if commits_response.status_code == 200 else []
         )
 
+        # Record today's snapshot and read the trend it extends
+        trend = None
+        if self.history:
+            full_name = repo.get("full_name", repo.get("name", "Unknown"))
+            self.history.record_snapshot(
+                full_name,
+                {
+                    "stars": repo.get("stargazers_count"),
+                    "forks": repo.get("forks_count"),
+                    "open_issues": repo.get("open_issues_count"),
+                    "recent_commits": len(recent_commits),
+                    "size": repo.get("size"),
+                },
+            )
+            trend = self.history.get_trends(full_name).get(full_name)
+
         # Calculate activity score
-        activity_score = self.calculate_activity_score(repo, recent_commits)
+        activity_score = self.calculate_activity_score(repo, recent_commits, trend)
 
         # Determine activity level
         activity_level = self.get_activity_level(activity_score, repo)
@@ -129,7 +276,7 @@ class GitHubRepoAnalyzer:
 
         return analysis
 
-    def calculate_activity_score(self, repo, recent_commits):
+    def calculate_activity_score(self, repo, recent_commits, trend=None):
         """Calculate an activity score based on various factors"""
         score = 0
 
@@ -165,8 +312,30 @@ class GitHubRepoAnalyzer:
         if isinstance(size, (int, float)) and size > 1000:  # Large projects
             score += 5
 
+        # Trends from the activity history (star/fork velocity, commit trend)
+        score += self.calculate_trend_score(trend)
+
         return score
 
+    def calculate_trend_score(self, trend):
+        """Calculate bonus points from a repository's recorded activity trend"""
+        # A span of a day or two is noise, not a trend
+        if not trend or trend["days"] < MIN_TREND_DAYS:
+            return 0
+
+        score = 0
+
+        # Stars and forks actually gained over the observed span, weighted like the totals
+        days = min(trend["days"], TREND_WINDOW_DAYS)
+        score += trend["star_velocity"] * days * 2
+        score += trend["fork_velocity"] * days * 5
+
+        # Commit activity picking up over the window
+        if trend["commit_trend"] > 0:
+            score += 10
+
+        return max(0, int(round(score)))
+
     def get_activity_level(self, score, repo):
         """Determine activity level based on score and other factors"""
         if repo["archived"] or repo["disabled"]:
@@ -210,6 +379,23 @@ class GitHubRepoAnalyzer:
             for lang, bytes in languages.items()
         }
 
+    def get_sorted_languages(self, analysis):
+        """Return (language, percentage) pairs by descending share
+
+        The result is stored on the analysis so it is sorted once per repository.
+        """
+        if "sorted_languages" not in analysis:
+            analysis["sorted_languages"] = sorted(
+                analysis["language_percentages"].items(),
+                key=lambda x: x[1],
+                reverse=True,
+            )
+        return analysis["sorted_languages"]
+
+    def get_project_title(self, analysis):
+        """Return the display title for a repository name"""
+        return analysis["name"].replace("-", " ").replace("_", " ").title()
+
     def generate_project_frontmatter(self, analysis):
         """Generate Jekyll frontmatter for a project"""
         # Determine if project should be featured (will be overridden by top 5 logic)
@@ -224,9 +410,7 @@ class GitHubRepoAnalyzer:
             technologies.append(analysis["primary_language"])
 
         # Add top languages by percentage
-        for lang, percentage in sorted(
-            analysis["language_percentages"].items(), key=lambda x: x[1], reverse=True
-        )[:3]:
+        for lang, percentage in self.get_sorted_languages(analysis)[:3]:
             if lang not in technologies:
                 technologies.append(lang)
 
@@ -234,7 +418,7 @@ class GitHubRepoAnalyzer:
         technologies.extend(analysis["topics"][:3])
 
         frontmatter = {
-            "title": analysis["name"].replace("-", " ").replace("_", " ").title(),
+            "title": self.get_project_title(analysis),
             "description": analysis["description"],
             "technologies": technologies[:5],  # Limit to 5 technologies
             "github": analysis["url"],
@@ -254,76 +438,178 @@ class GitHubRepoAnalyzer:
 
     def generate_project_content(self, analysis):
         """Generate the main content for a project page"""
-        content = (
-            f"## {analysis['name'].replace('-', ' ').replace('_', ' ').title()}\n\n"
-        )
-        content += f"{analysis['description']}\n\n"
-
-        # Activity status
-        activity_emoji = {
-            "very_active": "🔥",
-            "active": "⚡",
-            "moderate": "📈",
-            "low": "📉",
-            "idle": "😴",
-            "archived": "📦",
-        }
-
-        content += f"**Status:** {activity_emoji.get(analysis['activity_level'], '❓')} {analysis['activity_level'].replace('_', ' ').title()}\n\n"
-
-        # Project stats
-        content += "## Project Stats\n\n"
-        content += f"- **Stars:** {analysis['stars']}\n"
-        content += f"- **Forks:** {analysis['forks']}\n"
-        content += f"- **Language:** {analysis['primary_language'] or 'Mixed'}\n"
+        parts = [
+            render_project_header(
+                title=self.get_project_title(analysis),
+                description=analysis["description"],
+                emoji=ACTIVITY_EMOJI.get(analysis["activity_level"], "❓"),
+                status=analysis["activity_level"].replace("_", " ").title(),
+                stars=analysis["stars"],
+                forks=analysis["forks"],
+                language=analysis["primary_language"] or "Mixed",
+            )
+        ]
         if analysis["license"]:
-            content += f"- **License:** {analysis['license']}\n"
-        content += f"- **Created:** {analysis['created_at'][:10]}\n"
-        content += f"- **Last Updated:** {analysis['pushed_at'][:10]}\n"
+            parts.append(render_license_line(analysis["license"]))
+        parts.append(
+            render_dates(
+                created=analysis["created_at"][:10],
+                updated=analysis["pushed_at"][:10],
+            )
+        )
 
         # Language breakdown
         if analysis["language_percentages"]:
-            content += "\n## Language Breakdown\n\n"
-            for lang, percentage in sorted(
-                analysis["language_percentages"].items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:5]:
-                content += f"- **{lang}:** {percentage}%\n"
+            parts.append("\n## Language Breakdown\n\n")
+            parts.extend(
+                render_language_line(lang, percentage)
+                for lang, percentage in self.get_sorted_languages(analysis)[:5]
+            )
 
         # Topics
         if analysis["topics"]:
-            content += "\n## Topics\n\n"
-            for topic in analysis["topics"]:
-                content += f"`{topic}` "
-            content += "\n"
+            parts.append("\n## Topics\n\n")
+            parts.extend(render_topic(topic) for topic in analysis["topics"])
+            parts.append("\n")
 
         # Links
-        content += "\n## Links\n\n"
-        content += f"- [View on GitHub]({analysis['url']})\n"
+        parts.append(render_links(analysis["url"]))
         if analysis["homepage"]:
-            content += f"- [Live Demo]({analysis['homepage']})\n"
+            parts.append(render_live_demo(analysis["homepage"]))
+
+        return "".join(parts)
+
+    def dump_frontmatter(self, frontmatter):
+        """Serialize frontmatter to YAML, using the C emitter when output is identical"""
+        dumper = YAML_C_DUMPER or yaml.Dumper
+        for value in frontmatter.values():
+            for item in value if isinstance(value, list) else (value,):
+                if isinstance(item, str) and not (
+                    item.isascii() and item.isprintable()
+                ):
+                    dumper = yaml.Dumper
+                    break
+
+        return yaml.dump(
+            frontmatter, Dumper=dumper, default_flow_style=False, sort_keys=False
+        )
 
-        return content
+    def render_project_page(self, analysis):
+        """Render the complete markdown page (frontmatter and content) for a project"""
+        frontmatter = self.dump_frontmatter(self.generate_project_frontmatter(analysis))
+        return "".join(
+            ("---\n", frontmatter, "---\n\n", self.generate_project_content(analysis))
+        )
 
     def save_project_file(self, analysis, output_dir):
         """Save a project analysis as a Jekyll markdown file"""
-        frontmatter = self.generate_project_frontmatter(analysis)
-        content = self.generate_project_content(analysis)
-
         # Create filename
         filename = f"{analysis['name']}.md"
         filepath = Path(output_dir) / filename
 
         # Write file
         with open(filepath, "w") as f:
-            f.write("---\n")
-            f.write(yaml.dump(frontmatter, default_flow_style=False, sort_keys=False))
-            f.write("---\n\n")
-            f.write(content)
+            f.write(self.render_project_page(analysis))
 
         return filepath
 
+    def generate_projects_data(self, analyses):
+        """Build the pre-sorted, pre-grouped projects data for docs/_data
+
+        Projects are ordered by activity score and grouped by activity level so
+        the projects page can render them in a single loop.
+        """
+        ranked = sorted(analyses, key=lambda x: x["activity_score"], reverse=True)
+
+        groups = []
+        for level, emoji, heading, label, stats_label in ACTIVITY_LEVELS:
+            projects = []
+            for analysis in ranked:
+                if analysis["activity_level"] != level:
+                    continue
+                frontmatter = self.generate_project_frontmatter(analysis)
+                projects.append(
+                    {
+                        "name": analysis["name"],
+                        "title": frontmatter["title"],
+                        "description": frontmatter["description"],
+                        "technologies": ", ".join(frontmatter["technologies"]),
+                        "stars": frontmatter["stars"],
+                        "forks": frontmatter["forks"],
+                        "last_updated": frontmatter["last_updated"],
+                        "github": frontmatter["github"],
+                        "live_url": frontmatter["live_url"],
+                        "activity_score": analysis["activity_score"],
+                    }
+                )
+
+            groups.append(
+                {
+                    "level": level,
+                    "emoji": emoji,
+                    "heading": heading,
+                    "label": label,
+                    "stats_label": stats_label,
+                    "count": len(projects),
+                    "projects": projects,
+                }
+            )
+
+        return {"total": len(ranked), "groups": groups}
+
+    def save_projects_data(self, analyses, data_path):
+        """Save the grouped projects data as a Jekyll data file"""
+        data_path = Path(data_path)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(data_path, "w") as f:
+            json.dump(
+                self.generate_projects_data(analyses), f, indent=2, ensure_ascii=False
+            )
+            f.write("\n")
+
+        return data_path
+
+
+def print_execution_plan(plan):
+    """Print a human-readable summary of an execution plan"""
+    rate_limit = plan["rate_limit"]
+    reset = datetime.fromtimestamp(rate_limit["reset"]).strftime("%Y-%m-%d %H:%M:%S")
+
+    print("\n" + "=" * 50)
+    print("EXECUTION PLAN")
+    print("=" * 50)
+    listing = "cached" if plan["listing_cached"] else "fetched"
+    print(f"Repositories: {plan['repositories']} (listing {listing})")
+    print("\nEstimated requests by endpoint:")
+    for endpoint, count in plan["requests_by_endpoint"].items():
+        print(f"  {endpoint}: {count}")
+    print(f"  total: {plan['total_requests']}")
+
+    print(
+        f"\nRate limit: {rate_limit['remaining']}/{rate_limit['limit']} remaining, "
+        f"resets at {reset} (reserve {plan['reserve']})"
+    )
+
+    if plan["fits_in_budget"]:
+        print("\n✅ The full run fits in the current rate-limit budget")
+        return
+
+    budget = rate_limit["remaining"] - plan["reserve"]
+    print(
+        f"\n⚠️  The full run needs {plan['total_requests'] - budget} more requests "
+        f"than the current budget and would run out after "
+        f"{plan['repositories_in_budget']} of {plan['repositories']} repositories"
+    )
+    print(f"   Wait until {reset}, or use a token for a higher rate limit")
+    print(
+        "   (--limit only analyzes the first repositories and leaves the rest "
+        "out of the site data)"
+    )
+    print(f"   Over budget: {', '.join(plan['over_budget_repositories'][:10])}", end="")
+    remaining = len(plan["over_budget_repositories"]) - 10
+    print(f" and {remaining} more" if remaining > 0 else "")
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -340,21 +626,98 @@ def main():
     parser.add_argument(
         "--limit", type=int, help="Limit number of repositories to analyze"
     )
+    parser.add_argument(
+        "--data-output",
+        default=str(DATA_DIR / "projects.json"),
+        help="Output path for the grouped projects data file",
+    )
+    parser.add_argument(
+        "--technologies-output",
+        default=str(DATA_DIR / "technologies.json"),
+        help="Output path for the account-wide languages and topics data file",
+    )
+    parser.add_argument(
+        "--technologies-snapshot",
+        default=str(DEFAULT_SNAPSHOT_PATH),
+        help="Snapshot of the previous run used to update the technologies index",
+    )
+    parser.add_argument(
+        "--listing-cache",
+        help="Repository listing cache (default .cache/repos-<username>.json)",
+    )
+    parser.add_argument(
+        "--cached-listing",
+        action="store_true",
+        help="Use the cached repository listing instead of fetching it",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Estimate API requests against the rate limit and exit without analyzing",
+    )
+    parser.add_argument(
+        "--plan-output", help="Write the execution plan as JSON to this path"
+    )
+    parser.add_argument(
+        "--reserve",
+        type=int,
+        default=10,
+        help="Requests to keep in reserve when planning (default 10)",
+    )
+    parser.add_argument(
+        "--history-db",
+        default=str(DEFAULT_DB_PATH),
+        help="SQLite database of activity snapshots used for trend scoring",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record snapshots or use activity trends",
+    )
 
     args = parser.parse_args()
 
-    # Create output directory
-    Path(args.output).mkdir(parents=True, exist_ok=True)
-
-    # Initialize analyzer
     analyzer = GitHubRepoAnalyzer(args.username, args.token)
 
-    print(f"Fetching repositories for {args.username}...")
-    repos = analyzer.get_repositories()
-
+    listing_path = Path(args.listing_cache or CACHE_DIR / f"repos-{args.username}.json")
+    listing_cached = args.cached_listing and listing_path.exists()
+    if listing_cached:
+        print(f"Using cached repository listing: {listing_path}")
+        repos = analyzer.load_repository_listing(listing_path)
+    else:
+        print(f"Fetching repositories for {args.username}...")
+        repos = analyzer.get_repositories()
+        analyzer.save_repository_listing(repos, listing_path)
+
+    listing_count = len(repos)
     if args.limit:
         repos = repos[: args.limit]
 
+    if args.plan:
+        # The run itself reads the listing from cache only with --cached-listing
+        plan = analyzer.build_execution_plan(
+            repos,
+            analyzer.get_rate_limit(),
+            listing_cached=args.cached_listing,
+            reserve=args.reserve,
+            listing_count=listing_count,
+        )
+        print_execution_plan(plan)
+        if args.plan_output:
+            Path(args.plan_output).parent.mkdir(parents=True, exist_ok=True)
+            with open(args.plan_output, "w") as f:
+                json.dump(plan, f, indent=2)
+            print(f"\nExecution plan saved to: {args.plan_output}")
+        return
+
+    # Create output directory
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+
+    # Initialize activity history
+    if not args.no_history:
+        analyzer.history = ActivityHistory(args.history_db)
+    history = analyzer.history
+
     print(f"Analyzing {len(repos)} repositories...")
 
     # Analyze each repository
@@ -384,6 +747,19 @@ def main():
         except Exception as e:
             print(f"Error saving {analysis['name']}: {e}")
 
+    data_path = analyzer.save_projects_data(analyses, args.data_output)
+    print(f"Saved projects data: {data_path}")
+
+    # Update the account-wide technologies index from the previous snapshot
+    technologies = TechnologyIndex(args.technologies_snapshot)
+    added, changed, removed = technologies.update(analyses, prune=not args.limit)
+    technologies.save_snapshot()
+    data_path = technologies.save_data(args.technologies_output)
+    print(
+        f"Saved technologies data: {data_path} "
+        f"({added} added, {changed} changed, {removed} removed)"
+    )
+
     # Generate summary
     print("\n" + "=" * 50)
     print("ANALYSIS SUMMARY")
@@ -394,21 +770,17 @@ def main():
         level = analysis["activity_level"]
         activity_counts[level] = activity_counts.get(level, 0) + 1
 
+    level_order = [level for level, *_ in ACTIVITY_LEVELS]
     for level, count in sorted(
-        activity_counts.items(),
-        key=lambda x: [
-            "very_active",
-            "active",
-            "moderate",
-            "low",
-            "idle",
-            "archived",
-        ].index(x[0]),
+        activity_counts.items(), key=lambda x: level_order.index(x[0])
     ):
         print(f"{level.replace('_', ' ').title()}: {count}")
 
     print(f"\nTotal repositories analyzed: {len(analyses)}")
     print(f"Project files saved to: {args.output}")
+    if history:
+        print(f"Activity snapshots recorded in: {args.history_db}")
+        history.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Client-side Search Index Builder for Jekyll Site
+Builds a compact, sharded inverted index over posts and project pages
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from site_content import (
+    DOCS_DIR,
+    POSTS_DIR,
+    PROJECTS_DIR,
+    iter_markdown_files,
+    load_document,
+    tokenize,
+)
+
+INDEX_VERSION = 1
+
+# Shards are keyed by the first character(s) of a term so any query prefix of that
+# length maps to exactly one shard
+SHARD_PREFIX_LENGTH = 1
+
+# Term weight per occurrence in each field
+FIELD_WEIGHTS = {
+    "title": 10,
+    "tags": 5,
+    "headings": 5,
+    "description": 3,
+    "text": 1,
+}
+
+
+class SearchIndexBuilder:
+    def __init__(self, prefix_length=SHARD_PREFIX_LENGTH):
+        self.prefix_length = prefix_length
+        self.documents = []
+        self.postings = defaultdict(dict)
+
+    def add_document(self, document):
+        """Index a document record and return its numeric doc ID"""
+        doc_id = len(self.documents)
+        self.documents.append(
+            {
+                "t": document["title"],
+                "u": document["url"],
+                "k": document["kind"],
+                "d": document["date"],
+            }
+        )
+
+        weights = defaultdict(int)
+        for field, weight in FIELD_WEIGHTS.items():
+            value = document[field]
+            text = " ".join(value) if isinstance(value, list) else value
+            for term in tokenize(text):
+                weights[term] += weight
+
+        for term, weight in weights.items():
+            self.postings[term][doc_id] = weight
+
+        return doc_id
+
+    def shard_key(self, term):
+        return term[: self.prefix_length]
+
+    def build_shards(self):
+        """Group terms into prefix shards
+
+        Each shard holds its terms sorted (so prefix matches are a contiguous
+        range) and a parallel list of flat [doc_id, weight, ...] postings, with
+        the highest weighted documents first.
+        """
+        shards = defaultdict(lambda: {"terms": [], "postings": []})
+        for term in sorted(self.postings):
+            shard = shards[self.shard_key(term)]
+            shard["terms"].append(term)
+
+            flat = []
+            ranked = sorted(self.postings[term].items(), key=lambda x: (-x[1], x[0]))
+            for doc_id, weight in ranked:
+                flat.extend((doc_id, weight))
+            shard["postings"].append(flat)
+
+        return dict(shards)
+
+    def write(self, output_dir):
+        """Write the manifest, document table and term shards as JSON assets"""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        shards = self.build_shards()
+        shard_files = {}
+        for key, shard in sorted(shards.items()):
+            filename = f"terms-{key}.json"
+            self._write_json(output_dir / filename, shard)
+            shard_files[key] = filename
+
+        # Remove shards left over from a previous build
+        for stale in output_dir.glob("terms-*.json"):
+            if stale.name not in shard_files.values():
+                stale.unlink()
+
+        self._write_json(output_dir / "docs.json", self.documents)
+        manifest = {
+            "version": INDEX_VERSION,
+            "prefix_length": self.prefix_length,
+            "doc_count": len(self.documents),
+            "term_count": len(self.postings),
+            "docs": "docs.json",
+            "shards": shard_files,
+        }
+        self._write_json(output_dir / "manifest.json", manifest)
+        return manifest
+
+    @staticmethod
+    def _write_json(path, data):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a sharded client-side search index for posts and projects"
+    )
+    parser.add_argument(
+        "--posts", default=str(POSTS_DIR), help="Directory containing Jekyll posts"
+    )
+    parser.add_argument(
+        "--projects",
+        default=str(PROJECTS_DIR),
+        help="Directory containing generated project pages",
+    )
+    parser.add_argument(
+        "--output",
+        default=str(DOCS_DIR / "assets" / "search"),
+        help="Output directory for the search index assets",
+    )
+
+    args = parser.parse_args()
+
+    builder = SearchIndexBuilder()
+    for kind, directory in (("post", args.posts), ("project", args.projects)):
+        for path in iter_markdown_files(directory):
+            try:
+                builder.add_document(load_document(path, kind))
+            except Exception as e:
+                print(f"Error indexing {path}: {e}")
+
+    manifest = builder.write(args.output)
+
+    print(
+        f"Indexed {manifest['doc_count']} documents, {manifest['term_count']} terms "
+        f"in {len(manifest['shards'])} shards"
+    )
+    print(f"Search index saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
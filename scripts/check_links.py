@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+External Link Checker for Jekyll Site
+Checks outbound links in posts and project pages concurrently, caching results
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+from site_content import (
+    CACHE_DIR,
+    POSTS_DIR,
+    PROJECTS_DIR,
+    iter_markdown_files,
+    split_front_matter,
+)
+
+DEFAULT_TTL_HOURS = 7 * 24
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 15
+USER_AGENT = "rl337.org-link-checker"
+
+MARKDOWN_LINK_RE = re.compile(
+    r"\[[^\]]*\]\(\s*<?(https?://[^)\s>]+)>?(?:\s+\"[^\"]*\")?\s*\)"
+)
+AUTOLINK_RE = re.compile(r"<(https?://[^>\s]+)>")
+HTML_LINK_RE = re.compile(r"(?:href|src)=[\"'](https?://[^\"']+)[\"']")
+URL_RE = re.compile(r"^https?://\S+$")
+
+
+def extract_links(text):
+    """Return the http(s) links of a markdown document, front matter included"""
+    front_matter, body = split_front_matter(text)
+
+    links = []
+    for value in front_matter.values():
+        if isinstance(value, str) and URL_RE.match(value):
+            links.append(value)
+    for pattern in (MARKDOWN_LINK_RE, AUTOLINK_RE, HTML_LINK_RE):
+        links.extend(pattern.findall(body))
+
+    return list(dict.fromkeys(links))
+
+
+def collect_links(paths):
+    """Map each unique link to the pages that reference it"""
+    pages_by_link = defaultdict(list)
+    for path in paths:
+        for link in extract_links(Path(path).read_text(encoding="utf-8")):
+            pages_by_link[link].append(str(path))
+    return dict(pages_by_link)
+
+
+class LinkChecker:
+    def __init__(
+        self,
+        cache_path=None,
+        ttl_hours=DEFAULT_TTL_HOURS,
+        concurrency=DEFAULT_CONCURRENCY,
+        per_host=DEFAULT_PER_HOST,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ttl = ttl_hours * 3600
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache = self._load_cache()
+        self._local = threading.local()
+
+    def _load_cache(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "w") as f:
+            json.dump(self.cache, f, indent=2, sort_keys=True)
+
+    def is_fresh(self, url, now=None):
+        """A cached result is reused while it is within the TTL and was a success"""
+        entry = self.cache.get(url)
+        now = now or time.time()
+        return bool(entry and entry["ok"] and now - entry["checked_at"] < self.ttl)
+
+    def _session(self):
+        # requests sessions are not shared between worker threads
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+            self._local.session.headers["User-Agent"] = USER_AGENT
+        return self._local.session
+
+    def check_url(self, url):
+        """Check one URL with HEAD, falling back to GET when HEAD is refused"""
+        session = self._session()
+        result = {"status": None, "ok": False, "error": None, "method": "HEAD"}
+        try:
+            response = session.head(url, allow_redirects=True, timeout=self.timeout)
+            result["status"] = response.status_code
+        except requests.RequestException as e:
+            result["error"] = str(e)
+
+        # Some servers reject or mishandle HEAD; confirm failures with GET
+        if result["status"] is None or result["status"] >= 400:
+            result["method"] = "GET"
+            try:
+                with session.get(
+                    url, allow_redirects=True, timeout=self.timeout, stream=True
+                ) as response:
+                    result["status"] = response.status_code
+                    result["error"] = None
+            except requests.RequestException as e:
+                result["error"] = str(e)
+
+        result["ok"] = result["status"] is not None and result["status"] < 400
+        result["checked_at"] = time.time()
+        return result
+
+    async def _check_all(self, urls):
+        loop = asyncio.get_running_loop()
+        host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+
+            async def check(url):
+                async with host_limits[urlsplit(url).netloc.lower()]:
+                    result = await loop.run_in_executor(executor, self.check_url, url)
+                self.cache[url] = result
+
+            await asyncio.gather(*(check(url) for url in urls))
+
+    def check(self, urls):
+        """Check every URL that is not freshly cached; return (results, checked count)"""
+        urls = list(dict.fromkeys(urls))
+        now = time.time()
+        stale = [url for url in urls if not self.is_fresh(url, now)]
+        if stale:
+            asyncio.run(self._check_all(stale))
+        return {url: self.cache[url] for url in urls}, len(stale)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check outbound links in posts and project pages"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="Markdown files or directories (default: posts and project pages)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=str(CACHE_DIR / "link_check.json"),
+        help="Result cache file",
+    )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_TTL_HOURS,
+        help="Hours a successful result is reused (failures are always rechecked)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum concurrent requests",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_PER_HOST,
+        help="Maximum concurrent requests per host",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT, help="Request timeout"
+    )
+
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths or [POSTS_DIR, PROJECTS_DIR]:
+        path = Path(path)
+        files.extend([path] if path.is_file() else iter_markdown_files(path))
+
+    pages_by_link = collect_links(files)
+    print(f"Found {len(pages_by_link)} unique links in {len(files)} pages")
+
+    checker = LinkChecker(
+        args.cache, args.ttl, args.concurrency, args.per_host, args.timeout
+    )
+    results, checked = checker.check(pages_by_link)
+    checker.save_cache()
+    print(f"Checked {checked} links ({len(results) - checked} cached)")
+
+    broken = {url: result for url, result in results.items() if not result["ok"]}
+    for url, result in sorted(broken.items()):
+        reason = result["status"] or result["error"]
+        print(f"❌ {url} ({reason})")
+        for page in pages_by_link[url]:
+            print(f"   in {page}")
+
+    if broken:
+        print(f"\n{len(broken)} broken links")
+        sys.exit(1)
+    print("✅ All links OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,12 @@ This script will generate contextually appropriate images for each blog post.
 import os
 import sys
 import asyncio
+import argparse
 import json
 from typing import Dict, List
 
+from image_cache import ImageCache
+
 # Add the midjourney_mcp to the path
 sys.path.append('/usr/local/lib/python3.10/dist-packages')
 
@@ -19,6 +22,11 @@ except ImportError:
     print("Error: midjourney_mcp not found. Make sure it's installed in the Docker container.")
     sys.exit(1)
 
+# Generator settings that affect the output image; part of the cache key
+MODEL_SETTINGS = {
+    "generator": "midjourney_mcp",
+}
+
 # Sugar glider decorative images for website
 SUGAR_GLIDER_IMAGES = {
     "logo": {
@@ -190,8 +198,34 @@ async def generate_image(prompt: str, aspect_ratio: str) -> str:
     except Exception as e:
         return f"Error generating image: {str(e)}"
 
-async def generate_all_images():
-    """Generate all images for blog posts and website decorations."""
+async def generate_cached_image(cache: ImageCache, image_spec: Dict, refresh: bool = False) -> str:
+    """Return the cached result for an unchanged prompt, generating it otherwise."""
+    prompt, aspect_ratio = image_spec["prompt"], image_spec["aspect_ratio"]
+
+    if not refresh:
+        entry = cache.get(prompt, aspect_ratio, MODEL_SETTINGS)
+        if entry:
+            print(f"     ♻️  Cached: {image_spec['filename']} ({entry['key'][:12]})")
+            # The result is the generated image's path; put the image back if it is gone
+            result = entry["result"]
+            if entry.get("artifact") and not os.path.isfile(result):
+                if cache.restore_artifact(entry, result):
+                    print(f"     📂 Restored image to {result}")
+            return result
+
+    result = await generate_image(prompt, aspect_ratio)
+    artifact = result if isinstance(result, str) and os.path.isfile(result) else None
+    if cache.put(image_spec["filename"], prompt, aspect_ratio, result, MODEL_SETTINGS, artifact):
+        cache.save()
+    print(f"     ✅ Generated: {image_spec['filename']}")
+    return result
+
+async def generate_all_images(refresh: bool = False):
+    """Generate all images for blog posts and website decorations.
+
+    Prompts whose (prompt, aspect ratio, model settings) hash is already cached are
+    not re-submitted unless refresh is set.
+    """
     print("🎨 Starting AI image generation for blog posts and website decorations...")
     print("=" * 70)
     
@@ -202,6 +236,7 @@ async def generate_all_images():
         print("You can get these from your Midjourney account.")
         return
     
+    cache = ImageCache()
     results = {}
     
     # Generate sugar glider decorative images
@@ -210,13 +245,12 @@ async def generate_all_images():
     
     for image_type, image_spec in SUGAR_GLIDER_IMAGES.items():
         print(f"  🖼️  Generating {image_spec['filename']}...")
-        result = await generate_image(image_spec["prompt"], image_spec["aspect_ratio"])
+        result = await generate_cached_image(cache, image_spec, refresh)
         results["sugar_gliders"].append({
             "filename": image_spec["filename"],
             "type": image_type,
             "result": result
         })
-        print(f"     ✅ Generated: {image_spec['filename']}")
     
     # Generate blog post images
     for project, data in BLOG_IMAGES.items():
@@ -225,12 +259,11 @@ async def generate_all_images():
         
         for image_spec in data["images"]:
             print(f"  🖼️  Generating {image_spec['filename']}...")
-            result = await generate_image(image_spec["prompt"], image_spec["aspect_ratio"])
+            result = await generate_cached_image(cache, image_spec, refresh)
             results[project].append({
                 "filename": image_spec["filename"],
                 "result": result
             })
-            print(f"     ✅ Generated: {image_spec['filename']}")
     
     # Save results to a file
     with open("image_generation_results.json", "w") as f:
@@ -238,6 +271,7 @@ async def generate_all_images():
     
     print("\n🎉 Image generation complete!")
     print("Results saved to image_generation_results.json")
+    print(f"Generation cache: {cache.cache_dir} (inspect with scripts/image_cache.py list)")
     print("\nNext steps:")
     print("1. Review the generated images")
     print("2. Download the images you like")
@@ -245,4 +279,10 @@ async def generate_all_images():
     print("4. Add sugar glider images to website decorations")
 
 if __name__ == "__main__":
-    asyncio.run(generate_all_images())
+    parser = argparse.ArgumentParser(description="Generate AI images for blog posts")
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="Ignore cached results and re-submit every prompt"
+    )
+    args = parser.parse_args()
+    asyncio.run(generate_all_images(refresh=args.refresh))
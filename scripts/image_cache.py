@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Persistent result cache for AI image generation.
+Maps a hash of (prompt, aspect ratio, model settings) to the stored generation result
+so that unchanged prompts are not re-submitted to the generator.
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "images"
+INDEX_FILENAME = "index.json"
+
+
+def prompt_key(prompt: str, aspect_ratio: str, settings: Optional[Dict] = None) -> str:
+    """Return a stable hash for a prompt, its aspect ratio and the model settings."""
+    payload = json.dumps(
+        {"prompt": prompt, "aspect_ratio": aspect_ratio, "settings": settings or {}},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_error_result(result) -> bool:
+    """Generation failures are reported as strings starting with 'Error'."""
+    return isinstance(result, str) and result.startswith("Error")
+
+
+class ImageCache:
+    """Prompt-hash keyed store of generation results and their image artifacts."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.index_path = self.cache_dir / INDEX_FILENAME
+        self.entries = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            print(f"⚠️  Ignoring unreadable image cache index: {self.index_path}")
+            return {}
+
+    def save(self):
+        """Write the index to disk."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        tmp_path.replace(self.index_path)
+
+    def artifact_path(self, key: str, filename: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{Path(filename).suffix}"
+
+    def get(self, prompt: str, aspect_ratio: str, settings: Optional[Dict] = None):
+        """Return the cached entry for a prompt, or None if it has not been generated."""
+        return self.entries.get(prompt_key(prompt, aspect_ratio, settings))
+
+    def put(
+        self,
+        filename: str,
+        prompt: str,
+        aspect_ratio: str,
+        result,
+        settings: Optional[Dict] = None,
+        artifact: Optional[Path] = None,
+    ) -> Optional[Dict]:
+        """Store a successful result, copying the image artifact into the cache if given.
+
+        Error results are never cached so that they are retried on the next run.
+        """
+        if is_error_result(result):
+            return None
+
+        key = prompt_key(prompt, aspect_ratio, settings)
+        entry = {
+            "key": key,
+            "filename": filename,
+            "prompt": prompt,
+            "aspect_ratio": aspect_ratio,
+            "settings": settings or {},
+            "result": result,
+            "artifact": None,
+            "created_at": time.time(),
+        }
+
+        if artifact is not None and Path(artifact).is_file():
+            stored = self.artifact_path(key, filename)
+            stored.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(artifact, stored)
+            entry["artifact"] = str(stored.relative_to(self.cache_dir))
+
+        self.entries[key] = entry
+        return entry
+
+    def restore_artifact(self, entry: Dict, destination) -> bool:
+        """Copy a cached image artifact to destination. Returns False if none is stored."""
+        if not entry.get("artifact"):
+            return False
+        source = self.cache_dir / entry["artifact"]
+        if not source.is_file():
+            return False
+        Path(destination).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, destination)
+        return True
+
+    def list_entries(self) -> List[Dict]:
+        """Return cached entries, most recently generated first."""
+        return sorted(
+            self.entries.values(), key=lambda e: e.get("created_at", 0), reverse=True
+        )
+
+    def evict(
+        self,
+        key: Optional[str] = None,
+        filename: Optional[str] = None,
+        older_than_days: Optional[float] = None,
+        evict_all: bool = False,
+    ) -> List[Dict]:
+        """Remove matching entries and their artifacts. Returns the evicted entries."""
+        cutoff = (
+            time.time() - older_than_days * 86400
+            if older_than_days is not None
+            else None
+        )
+
+        evicted = []
+        for entry_key, entry in list(self.entries.items()):
+            if not (
+                evict_all
+                or (key and entry_key.startswith(key))
+                or (filename and entry.get("filename") == filename)
+                or (cutoff is not None and entry.get("created_at", 0) < cutoff)
+            ):
+                continue
+            if entry.get("artifact"):
+                artifact = self.cache_dir / entry["artifact"]
+                if artifact.exists():
+                    artifact.unlink()
+            del self.entries[entry_key]
+            evicted.append(entry)
+
+        return evicted
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Inspect and evict cached image generations"
+    )
+    parser.add_argument(
+        "--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Image cache directory"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="List cached generations")
+
+    evict_parser = subparsers.add_parser("evict", help="Remove cached generations")
+    evict_parser.add_argument(
+        "--key", help="Evict entries whose key starts with this prefix"
+    )
+    evict_parser.add_argument(
+        "--filename", help="Evict entries for this output filename"
+    )
+    evict_parser.add_argument(
+        "--older-than", type=float, metavar="DAYS", help="Evict entries older than DAYS"
+    )
+    evict_parser.add_argument("--all", action="store_true", help="Evict every entry")
+
+    args = parser.parse_args()
+    cache = ImageCache(args.cache_dir)
+
+    if args.command == "list":
+        entries = cache.list_entries()
+        for entry in entries:
+            created = time.strftime(
+                "%Y-%m-%d %H:%M", time.localtime(entry["created_at"])
+            )
+            artifact = "artifact" if entry.get("artifact") else "result only"
+            print(
+                f"{entry['key'][:12]}  {created}  {entry['aspect_ratio']:>5}  "
+                f"{entry['filename']} ({artifact})"
+            )
+        print(f"\n{len(entries)} cached generation(s) in {cache.cache_dir}")
+        return
+
+    if not (args.key or args.filename or args.older_than is not None or args.all):
+        parser.error("evict needs one of --key, --filename, --older-than or --all")
+
+    evicted = cache.evict(
+        key=args.key,
+        filename=args.filename,
+        older_than_days=args.older_than,
+        evict_all=args.all,
+    )
+    cache.save()
+    for entry in evicted:
+        print(f"Evicted {entry['key'][:12]}  {entry['filename']}")
+    print(f"\n{len(evicted)} cached generation(s) evicted")
+
+
+if __name__ == "__main__":
+    main()
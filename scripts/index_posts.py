@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Post Indexer for Jekyll Site
+Parses post front matter in parallel and precomputes tag, category and
+related-post data files so layouts do not compute them during the build
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from site_content import (
+    CACHE_DIR,
+    CONFIG_PATH,
+    DATA_DIR,
+    POSTS_DIR,
+    iter_markdown_files,
+    load_document,
+    tokenize,
+)
+
+try:
+    import numpy as np
+except ImportError:  # Related posts fall back to pure Python
+    np = None
+
+CACHE_VERSION = 2
+DEFAULT_TOP_K = 3
+
+# Tags and categories repeat their terms so they count for more than body text
+TAG_BOOST = 3
+
+
+def parse_post(path):
+    """Parse a post into the fields the indexes need (runs in a worker process)"""
+    document = load_document(path, "post")
+    terms = Counter(tokenize(document["title"] + " " + document["text"]))
+    for label in document["tags"] + document["categories"]:
+        for term in tokenize(label):
+            terms[term] += TAG_BOOST
+
+    return {
+        "slug": document["slug"],
+        "title": document["title"],
+        "url": document["url"],
+        "date": document["date"],
+        "tags": document["tags"],
+        "categories": document["categories"],
+        "terms": dict(terms),
+    }
+
+
+def file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def config_signature(config_path):
+    """Hash of the site config; post URLs depend on its timezone and permalink"""
+    try:
+        return hashlib.sha256(Path(config_path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class PostIndexer:
+    def __init__(self, cache_path=None, workers=None, config_path=CONFIG_PATH):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.workers = workers
+        self.config = config_signature(config_path)
+        self.cache = self._load_cache()
+
+    def _load_cache(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Parsed posts are only valid for the config they were parsed under
+        if cache.get("version") != CACHE_VERSION or cache.get("config") != self.config:
+            return {}
+        return cache.get("posts", {})
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "w") as f:
+            json.dump(
+                {"version": CACHE_VERSION, "config": self.config, "posts": self.cache},
+                f,
+            )
+
+    def parse_posts(self, paths):
+        """Parse posts in parallel, reusing cached results for unchanged files
+
+        Returns the parsed posts (in path order) and the number actually parsed.
+        """
+        paths = [str(path) for path in paths]
+        signatures = {path: file_signature(path) for path in paths}
+        stale = [
+            path
+            for path in paths
+            if self.cache.get(path, {}).get("signature") != signatures[path]
+        ]
+
+        if len(stale) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                parsed = list(executor.map(parse_post, stale))
+        else:
+            parsed = [parse_post(path) for path in stale]
+
+        for path, post in zip(stale, parsed):
+            self.cache[path] = {"signature": signatures[path], "post": post}
+
+        # Drop cache entries for deleted posts
+        for path in set(self.cache) - set(paths):
+            del self.cache[path]
+
+        return [self.cache[path]["post"] for path in paths], len(stale)
+
+    @staticmethod
+    def build_label_index(posts, field):
+        """Map each tag or category to its posts, newest first"""
+        index = defaultdict(list)
+        for post in sorted(posts, key=lambda p: p["date"] or "", reverse=True):
+            for label in dict.fromkeys(post[field]):
+                index[label].append(
+                    {"title": post["title"], "url": post["url"], "date": post["date"]}
+                )
+        return dict(sorted(index.items()))
+
+    @staticmethod
+    def similarity_matrix(posts):
+        """Return the pairwise TF-IDF cosine similarity of posts"""
+        vocabulary = sorted({term for post in posts for term in post["terms"]})
+        if not posts or not vocabulary:
+            return [[0.0] * len(posts) for _ in posts]
+
+        column = {term: i for i, term in enumerate(vocabulary)}
+        document_frequency = Counter(term for post in posts for term in post["terms"])
+        idf = [
+            math.log((1 + len(posts)) / (1 + document_frequency[term])) + 1
+            for term in vocabulary
+        ]
+
+        if np is not None:
+            tf = np.zeros((len(posts), len(vocabulary)))
+            for row, post in enumerate(posts):
+                for term, count in post["terms"].items():
+                    tf[row, column[term]] = count
+            weights = (1 + np.log(tf, where=tf > 0, out=np.zeros_like(tf))) * (tf > 0)
+            weights *= np.array(idf)
+            norms = np.linalg.norm(weights, axis=1, keepdims=True)
+            weights /= np.where(norms == 0, 1, norms)
+            return (weights @ weights.T).tolist()
+
+        vectors = []
+        for post in posts:
+            vector = {
+                column[term]: (1 + math.log(count)) * idf[column[term]]
+                for term, count in post["terms"].items()
+            }
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1
+            vectors.append({i: w / norm for i, w in vector.items()})
+
+        return [
+            [sum(w * b.get(i, 0.0) for i, w in a.items()) for b in vectors]
+            for a in vectors
+        ]
+
+    def build_related_posts(self, posts, top_k=DEFAULT_TOP_K):
+        """Return the top_k most similar posts for each post slug"""
+        similarity = self.similarity_matrix(posts)
+
+        related = {}
+        for i, post in enumerate(posts):
+            ranked = sorted(
+                (j for j in range(len(posts)) if j != i and similarity[i][j] > 0),
+                key=lambda j: (-similarity[i][j], posts[j]["slug"]),
+            )[:top_k]
+            related[post["slug"]] = [
+                {
+                    "title": posts[j]["title"],
+                    "url": posts[j]["url"],
+                    "score": round(similarity[i][j], 4),
+                }
+                for j in ranked
+            ]
+        return related
+
+    def write_data_files(self, posts, data_dir, top_k=DEFAULT_TOP_K):
+        """Write tags.json, categories.json and related_posts.json to data_dir"""
+        data_dir = Path(data_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        outputs = {
+            "tags.json": self.build_label_index(posts, "tags"),
+            "categories.json": self.build_label_index(posts, "categories"),
+            "related_posts.json": self.build_related_posts(posts, top_k),
+        }
+        for filename, data in outputs.items():
+            with open(data_dir / filename, "w") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+
+        return [data_dir / filename for filename in outputs]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Precompute tag, category and related-post data for Jekyll posts"
+    )
+    parser.add_argument(
+        "--posts", default=str(POSTS_DIR), help="Directory containing Jekyll posts"
+    )
+    parser.add_argument(
+        "--output", default=str(DATA_DIR), help="Jekyll data directory to write to"
+    )
+    parser.add_argument(
+        "--cache",
+        default=str(CACHE_DIR / "posts_index.json"),
+        help="Parse cache used to skip unchanged posts",
+    )
+    parser.add_argument(
+        "--top-k", type=int, default=DEFAULT_TOP_K, help="Related posts per post"
+    )
+    parser.add_argument("--workers", type=int, help="Number of parser processes")
+
+    args = parser.parse_args()
+
+    indexer = PostIndexer(args.cache, args.workers)
+    posts, parsed = indexer.parse_posts(iter_markdown_files(args.posts))
+    print(f"Parsed {parsed} of {len(posts)} posts ({len(posts) - parsed} unchanged)")
+
+    for filepath in indexer.write_data_files(posts, args.output, args.top_k):
+        print(f"Saved: {filepath}")
+
+    indexer.save_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Page Weight Analyzer for the Built Jekyll Site
+Measures the transfer weight of every built page and its local assets and
+checks it against a budget file
+"""
+
+import argparse
+import fnmatch
+import gzip
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import yaml
+
+from site_content import DOCS_DIR
+
+DEFAULT_BUDGET_PATH = Path(__file__).resolve().parent / "page_budget.yml"
+DEFAULT_TOP_ASSETS = 5
+
+# Text assets are compressed in transit; images and fonts are sent as they are
+COMPRESSIBLE_EXTENSIONS = (
+    ".html",
+    ".css",
+    ".js",
+    ".json",
+    ".xml",
+    ".svg",
+    ".txt",
+)
+BUDGET_KEYS = (
+    "max_html_bytes",
+    "max_raw_bytes",
+    "max_compressed_bytes",
+    "max_asset_bytes",
+    "max_requests",
+)
+
+LINK_RELS = {
+    "stylesheet",
+    "icon",
+    "shortcut",
+    "apple-touch-icon",
+    "preload",
+    "manifest",
+}
+CSS_URL_RE = re.compile(r"url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+
+
+def first_candidate(srcset):
+    """Return the URL of the first candidate of a srcset attribute"""
+    candidates = [c.split() for c in (srcset or "").split(",") if c.strip()]
+    return candidates[0][0] if candidates else None
+
+
+class AssetReferenceParser(HTMLParser):
+    """Collect the URLs of assets a page loads
+
+    A browser downloads one image per <img> or <picture>, so only one candidate
+    is counted for each: the <img> src, else its first srcset candidate, else
+    the first <source> candidate of its <picture>. Media elements count their
+    src or first <source>, plus the poster.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.references = []
+        self._picture = None
+        self._media_source = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "picture":
+            self._picture = []
+        elif tag == "source":
+            if self._picture is not None:
+                candidate = first_candidate(attrs.get("srcset")) or attrs.get("src")
+                if candidate:
+                    self._picture.append(candidate)
+            elif self._media_source is False and attrs.get("src"):
+                self.references.append(attrs["src"])
+                self._media_source = True
+        elif tag == "img":
+            candidate = attrs.get("src") or first_candidate(attrs.get("srcset"))
+            if not candidate and self._picture:
+                candidate = self._picture[0]
+            if candidate:
+                self.references.append(candidate)
+        elif tag in ("video", "audio"):
+            self._media_source = bool(attrs.get("src"))
+            for name in ("src", "poster"):
+                if attrs.get(name):
+                    self.references.append(attrs[name])
+        elif tag in ("script", "embed", "track") and attrs.get("src"):
+            self.references.append(attrs["src"])
+        elif tag == "link" and attrs.get("href"):
+            if LINK_RELS & set((attrs.get("rel") or "").lower().split()):
+                self.references.append(attrs["href"])
+
+    def handle_endtag(self, tag):
+        if tag == "picture":
+            self._picture = None
+        elif tag in ("video", "audio"):
+            self._media_source = None
+
+
+def is_local(url):
+    parts = urlsplit(url)
+    return not (parts.scheme or parts.netloc) and bool(parts.path)
+
+
+class PageWeightAnalyzer:
+    def __init__(self, site_dir, baseurl=""):
+        self.site_dir = Path(site_dir).resolve()
+        self.baseurl = baseurl.rstrip("/")
+        self._sizes = {}
+
+    def resolve(self, url, page_path):
+        """Map a local URL to a file in the built site, or None if it is missing"""
+        path = unquote(urlsplit(url).path)
+        if path.startswith("/"):
+            if self.baseurl and path.startswith(self.baseurl + "/"):
+                path = path.removeprefix(self.baseurl)
+            target = self.site_dir / path.lstrip("/")
+        else:
+            target = page_path.parent / path
+
+        target = target.resolve()
+        if target.is_dir():
+            target = target / "index.html"
+        if self.site_dir not in target.parents or not target.is_file():
+            return None
+        return target
+
+    def asset_sizes(self, path):
+        """Return (raw, compressed) transfer size of a file"""
+        if path not in self._sizes:
+            raw = path.stat().st_size
+            compressed = raw
+            if path.suffix.lower() in COMPRESSIBLE_EXTENSIONS:
+                sibling = path.with_name(path.name + ".gz")
+                if sibling.is_file():
+                    compressed = min(raw, sibling.stat().st_size)
+                else:
+                    compressed = min(
+                        raw, len(gzip.compress(path.read_bytes(), compresslevel=9))
+                    )
+            self._sizes[path] = (raw, compressed)
+        return self._sizes[path]
+
+    def page_assets(self, page_path):
+        """Resolve the local assets a page loads, including those its CSS references
+
+        Returns the unique asset paths and the local URLs that could not be found.
+        """
+        parser = AssetReferenceParser()
+        parser.feed(page_path.read_text(encoding="utf-8", errors="replace"))
+
+        assets, missing = {}, []
+        pending = [(url, page_path) for url in parser.references]
+        while pending:
+            url, referrer = pending.pop(0)
+            if not is_local(url):
+                continue
+            target = self.resolve(url, referrer)
+            if target is None:
+                missing.append(url)
+                continue
+            if target in assets:
+                continue
+            assets[target] = url
+            if target.suffix.lower() == ".css":
+                css = target.read_text(encoding="utf-8", errors="replace")
+                pending.extend((ref, target) for ref in CSS_URL_RE.findall(css))
+
+        return list(assets), list(dict.fromkeys(missing))
+
+    def analyze_page(self, page_path, top_assets=DEFAULT_TOP_ASSETS):
+        """Measure a page's total transfer weight, raw and compressed"""
+        page_path = Path(page_path).resolve()
+        html_raw, html_compressed = self.asset_sizes(page_path)
+        assets, missing = self.page_assets(page_path)
+
+        entries = []
+        for asset in assets:
+            raw, compressed = self.asset_sizes(asset)
+            entries.append(
+                {
+                    "path": str(asset.relative_to(self.site_dir)),
+                    "type": asset.suffix.lower().lstrip(".") or "other",
+                    "raw_bytes": raw,
+                    "compressed_bytes": compressed,
+                }
+            )
+        entries.sort(key=lambda e: (-e["compressed_bytes"], e["path"]))
+
+        return {
+            "page": str(page_path.relative_to(self.site_dir)),
+            "html_bytes": html_compressed,
+            "raw_bytes": html_raw + sum(e["raw_bytes"] for e in entries),
+            "compressed_bytes": html_compressed
+            + sum(e["compressed_bytes"] for e in entries),
+            "requests": 1 + len(entries),
+            "largest_asset_bytes": entries[0]["compressed_bytes"] if entries else 0,
+            "heaviest_assets": entries[:top_assets],
+            "missing_assets": missing,
+        }
+
+    def find_pages(self):
+        return sorted(
+            path
+            for path in self.site_dir.rglob("*.html")
+            if path.is_file() and not path.name.startswith("_")
+        )
+
+    def analyze_site(self, top_assets=DEFAULT_TOP_ASSETS):
+        """Analyze every built page and list the heaviest assets across the site"""
+        pages = [self.analyze_page(page, top_assets) for page in self.find_pages()]
+
+        heaviest = {}
+        for page in pages:
+            for asset in page["heaviest_assets"]:
+                heaviest.setdefault(asset["path"], asset)
+        heaviest_assets = sorted(
+            heaviest.values(), key=lambda e: (-e["compressed_bytes"], e["path"])
+        )[:top_assets]
+
+        pages.sort(key=lambda p: (-p["compressed_bytes"], p["page"]))
+        return {"pages": pages, "heaviest_assets": heaviest_assets}
+
+
+def load_budget(path):
+    """Load a budget file: a default budget and optional per-page glob overrides"""
+    with open(path) as f:
+        budget = yaml.safe_load(f) or {}
+    for section in [budget.get("default")] + list((budget.get("pages") or {}).values()):
+        unknown = set(section or {}) - set(BUDGET_KEYS)
+        if unknown:
+            raise ValueError(
+                f"Unknown budget keys in {path}: {', '.join(sorted(unknown))}"
+            )
+    return budget
+
+
+def budget_for_page(budget, page):
+    """Return the effective limits for a page; later matching globs win"""
+    limits = dict(budget.get("default") or {})
+    for pattern, overrides in (budget.get("pages") or {}).items():
+        if fnmatch.fnmatch(page, pattern):
+            limits.update(overrides or {})
+    return limits
+
+
+def check_budget(report, budget):
+    """Return the budget violations of an analyzed site"""
+    measures = {
+        "max_html_bytes": "html_bytes",
+        "max_raw_bytes": "raw_bytes",
+        "max_compressed_bytes": "compressed_bytes",
+        "max_asset_bytes": "largest_asset_bytes",
+        "max_requests": "requests",
+    }
+
+    violations = []
+    for page in report["pages"]:
+        for key, limit in budget_for_page(budget, page["page"]).items():
+            if limit is not None and page[measures[key]] > limit:
+                violations.append(
+                    {
+                        "page": page["page"],
+                        "budget": key,
+                        "limit": limit,
+                        "actual": page[measures[key]],
+                    }
+                )
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure page weight of the built site against a budget"
+    )
+    parser.add_argument(
+        "--site", default=str(DOCS_DIR / "_site"), help="Built site directory"
+    )
+    parser.add_argument(
+        "--budget", default=str(DEFAULT_BUDGET_PATH), help="Budget file (YAML)"
+    )
+    parser.add_argument("--baseurl", default="", help="Site baseurl to strip from URLs")
+    parser.add_argument("--report", help="Write the JSON report to this path")
+    parser.add_argument(
+        "--top", type=int, default=DEFAULT_TOP_ASSETS, help="Heaviest assets to list"
+    )
+    parser.add_argument(
+        "--no-fail",
+        action="store_true",
+        help="Exit successfully even when a budget is exceeded",
+    )
+
+    args = parser.parse_args()
+
+    if not Path(args.site).is_dir():
+        parser.error(f"site directory not found: {args.site}")
+
+    analyzer = PageWeightAnalyzer(args.site, args.baseurl)
+    report = analyzer.analyze_site(args.top)
+    report["budget_violations"] = check_budget(report, load_budget(args.budget))
+    report["ok"] = not report["budget_violations"]
+
+    if args.report:
+        Path(args.report).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report saved to: {args.report}")
+
+    print(f"{'Page':<50}{'Requests':>9}{'Raw':>12}{'Compressed':>12}")
+    for page in report["pages"][: args.top]:
+        print(
+            f"{page['page'][:49]:<50}{page['requests']:>9}"
+            f"{page['raw_bytes']:>12,}{page['compressed_bytes']:>12,}"
+        )
+
+    print("\nHeaviest assets:")
+    for asset in report["heaviest_assets"]:
+        print(f"  {asset['path']} ({asset['compressed_bytes']:,} bytes)")
+
+    for page in report["pages"]:
+        for url in page["missing_assets"]:
+            print(f"⚠️  {page['page']}: missing asset {url}")
+
+    for violation in report["budget_violations"]:
+        print(
+            f"❌ {violation['page']}: {violation['budget']} "
+            f"{violation['actual']:,} > {violation['limit']:,}"
+        )
+
+    if report["ok"]:
+        print(f"\n✅ {len(report['pages'])} pages within budget")
+    else:
+        print(f"\n{len(report['budget_violations'])} budget violations")
+        if not args.no_fail:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
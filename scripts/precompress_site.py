@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Precompression Stage for the Built Jekyll Site
+Writes maximum-level .gz (and .br, when Brotli is installed) siblings for text assets
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from site_content import CACHE_DIR, DOCS_DIR
+
+try:
+    import brotli
+except ImportError:  # .br siblings are only written when Brotli is available
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".html",
+    ".css",
+    ".js",
+    ".json",
+    ".xml",
+    ".svg",
+    ".txt",
+)
+SIBLING_SUFFIXES = (".gz", ".br")
+DEFAULT_MIN_SIZE = 256
+MANIFEST_VERSION = 2
+
+
+def compress_file(path, known_hashes=None, use_brotli=True):
+    """Write compressed siblings for one file unless they are already current
+
+    A sibling is current when it exists and the manifest records that it was
+    written from the file's present content. Siblings of encoders that are not
+    run are removed, since nothing vouches for what they contain.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    known_hashes = known_hashes or {}
+    encoders = {".gz": lambda d: gzip.compress(d, compresslevel=9, mtime=0)}
+    if use_brotli and brotli is not None:
+        encoders[".br"] = lambda d: brotli.compress(d, quality=11)
+
+    source_mtime = path.stat().st_mtime
+    result = {
+        "path": str(path),
+        "hash": digest,
+        "size": len(data),
+        "written": False,
+        "siblings": {},
+    }
+    for suffix in SIBLING_SUFFIXES:
+        sibling = path.with_name(path.name + suffix)
+        encode = encoders.get(suffix)
+        if encode is None:
+            if sibling.exists():
+                sibling.unlink()
+            continue
+
+        if not (sibling.exists() and known_hashes.get(suffix) == digest):
+            compressed = encode(data)
+            if len(compressed) >= len(data):
+                # Not worth serving; drop any stale sibling
+                if sibling.exists():
+                    sibling.unlink()
+                continue
+            sibling.write_bytes(compressed)
+            result["written"] = True
+
+        os.utime(sibling, (source_mtime, source_mtime))
+        result[suffix] = sibling.stat().st_size
+        result["siblings"][suffix] = digest
+
+    return result
+
+
+class SitePrecompressor:
+    def __init__(
+        self, site_dir, manifest_path=None, min_size=DEFAULT_MIN_SIZE, workers=None
+    ):
+        self.site_dir = Path(site_dir)
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.min_size = min_size
+        self.workers = workers
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        if not self.manifest_path or not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("files", {})
+
+    def save_manifest(self):
+        if not self.manifest_path:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, "w") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "files": self.manifest},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+    def find_assets(self):
+        """Return the compressible files of the site that are large enough to gain"""
+        return sorted(
+            path
+            for path in self.site_dir.rglob("*")
+            if path.is_file()
+            and path.suffix.lower() in COMPRESSIBLE_EXTENSIONS
+            and path.stat().st_size >= self.min_size
+        )
+
+    def run(self, use_brotli=True):
+        """Compress all assets in parallel and return per-file results"""
+        assets = self.find_assets()
+        relative = [str(path.relative_to(self.site_dir)) for path in assets]
+        known = [self.manifest.get(name) for name in relative]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = list(
+                executor.map(compress_file, assets, known, [use_brotli] * len(assets))
+            )
+
+        self.remove_orphans(assets)
+        self.manifest = {
+            name: result["siblings"] for name, result in zip(relative, results)
+        }
+        return results
+
+    def remove_orphans(self, assets):
+        """Delete siblings whose source is gone or is no longer compressed"""
+        assets = set(assets)
+        removed = []
+        for suffix in SIBLING_SUFFIXES:
+            for sibling in self.site_dir.rglob(f"*{suffix}"):
+                source = sibling.with_suffix("")
+                # Leave alone archives that were never ours, such as a .tar.gz download
+                if source.suffix.lower() not in COMPRESSIBLE_EXTENSIONS:
+                    continue
+                if source not in assets:
+                    sibling.unlink()
+                    removed.append(sibling)
+        return removed
+
+    @staticmethod
+    def summarize(results):
+        """Total original and compressed bytes per asset type"""
+        summary = defaultdict(
+            lambda: {"files": 0, "written": 0, "bytes": 0, ".gz": 0, ".br": 0}
+        )
+        for result in results:
+            totals = summary[Path(result["path"]).suffix.lower()]
+            totals["files"] += 1
+            totals["written"] += int(result["written"])
+            totals["bytes"] += result["size"]
+            for suffix in (".gz", ".br"):
+                totals[suffix] += result.get(suffix, result["size"])
+        return dict(sorted(summary.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write precompressed .gz/.br siblings for the built Jekyll site"
+    )
+    parser.add_argument(
+        "--site", default=str(DOCS_DIR / "_site"), help="Built site directory"
+    )
+    parser.add_argument(
+        "--manifest",
+        default=str(CACHE_DIR / "precompress.json"),
+        help="Content hashes of compressed files, used to skip unchanged files",
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=DEFAULT_MIN_SIZE,
+        help="Skip files smaller than this many bytes",
+    )
+    parser.add_argument("--no-brotli", action="store_true", help="Only write .gz")
+    parser.add_argument("--workers", type=int, help="Number of worker processes")
+
+    args = parser.parse_args()
+
+    if not Path(args.site).is_dir():
+        parser.error(f"site directory not found: {args.site}")
+    if brotli is None and not args.no_brotli:
+        print("Brotli module not installed; writing .gz siblings only")
+
+    precompressor = SitePrecompressor(
+        args.site, args.manifest, args.min_size, args.workers
+    )
+    results = precompressor.run(use_brotli=not args.no_brotli)
+    precompressor.save_manifest()
+
+    print(
+        f"{'Type':<8}{'Files':>7}{'Written':>9}{'Original':>12}{'gzip':>12}{'brotli':>12}"
+    )
+    for extension, totals in precompressor.summarize(results).items():
+        print(
+            f"{extension:<8}{totals['files']:>7}{totals['written']:>9}"
+            f"{totals['bytes']:>12,}{totals['bytes'] - totals['.gz']:>+12,}"
+            f"{totals['bytes'] - totals['.br']:>+12,}"
+        )
+    print("(gzip and brotli columns show bytes saved)")
+
+
+if __name__ == "__main__":
+    main()
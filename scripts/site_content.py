@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Helpers for reading Jekyll site content
+Parses front matter and markdown bodies of posts and generated project pages
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DOCS_DIR = REPO_ROOT / "docs"
+POSTS_DIR = DOCS_DIR / "_posts"
+PROJECTS_DIR = DOCS_DIR / "_projects"
+DATA_DIR = DOCS_DIR / "_data"
+CACHE_DIR = REPO_ROOT / ".cache"
+CONFIG_PATH = DOCS_DIR / "_config.yml"
+
+MARKDOWN_EXTENSIONS = (".md", ".markdown")
+
+POST_FILENAME_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})-(.+)$")
+HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$", re.MULTILINE)
+LIQUID_RE = re.compile(r"{%.*?%}|{{.*?}}", re.DOTALL)
+IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+MARKUP_RE = re.compile(r"[*_`>#|~]+")
+TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+# Front matter date forms Jekyll accepts that YAML leaves as strings
+DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S %z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M %z",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+)
+
+STOP_WORDS = frozenset("""
+    a an and are as at be but by for from had has have i if in into is it its
+    me my of on or so that the their then there these they this to was we were
+    what when which while who will with you your
+    """.split())
+
+
+def split_front_matter(text):
+    """Split a Jekyll document into its front matter dict and body"""
+    if not text.startswith("---"):
+        return {}, text
+
+    parts = text.split("\n---", 1)
+    if len(parts) != 2:
+        return {}, text
+
+    front_matter = yaml.safe_load(parts[0][3:]) or {}
+    body = parts[1].split("\n", 1)[1] if "\n" in parts[1] else ""
+    return (front_matter if isinstance(front_matter, dict) else {}), body
+
+
+def markdown_to_text(body):
+    """Reduce a markdown body to plain text for indexing"""
+    text = LIQUID_RE.sub(" ", body)
+    text = IMAGE_RE.sub(r"\1", text)
+    text = LINK_RE.sub(r"\1", text)
+    text = HTML_TAG_RE.sub(" ", text)
+    text = MARKUP_RE.sub(" ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def extract_headings(body):
+    """Return the markdown headings of a body in document order"""
+    return [markdown_to_text(heading) for heading in HEADING_RE.findall(body)]
+
+
+def as_list(value):
+    """Normalize a front matter list field that may be a string or missing"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return value.split()
+    return [str(item) for item in value]
+
+
+def tokenize(text):
+    """Lowercase text and split it into indexable terms"""
+    return [
+        token
+        for token in TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+def post_slug(path):
+    """Return the slug of a post from its filename (date prefix removed)"""
+    match = POST_FILENAME_RE.match(Path(path).stem)
+    return match.group(4) if match else Path(path).stem
+
+
+@lru_cache(maxsize=None)
+def site_timezone(config_path=CONFIG_PATH):
+    """Return the timezone set in the site config, or None when there is none"""
+    try:
+        with open(config_path) as f:
+            config = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError):
+        return None
+    try:
+        return ZoneInfo(config["timezone"]) if config.get("timezone") else None
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def parse_date(value):
+    """Parse a front matter date into a datetime, or None if it is not one"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if not isinstance(value, str):
+        return None
+
+    value = value.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def post_date(path, front_matter, timezone=None):
+    """Return the YYYY-MM-DD publication date of a post
+
+    Like Jekyll, dates with a UTC offset are converted to the site timezone
+    (from _config.yml unless timezone is given) before the day is taken.
+    """
+    value = front_matter.get("date")
+    published = parse_date(value)
+    if published is not None:
+        timezone = timezone or site_timezone()
+        if timezone is not None and published.tzinfo is not None:
+            published = published.astimezone(timezone)
+        return published.strftime("%Y-%m-%d")
+    if isinstance(value, str) and len(value) >= 10:
+        return value[:10]
+
+    match = POST_FILENAME_RE.match(Path(path).stem)
+    return "-".join(match.groups()[:3]) if match else None
+
+
+def post_url(path, front_matter, timezone=None):
+    """Return the URL Jekyll's default date permalink gives a post"""
+    if front_matter.get("permalink"):
+        return front_matter["permalink"]
+
+    categories = as_list(front_matter.get("categories") or front_matter.get("category"))
+    published = post_date(path, front_matter, timezone)
+    date_parts = published.split("-") if published else []
+    parts = categories + date_parts + [f"{post_slug(path)}.html"]
+    return "/" + "/".join(part for part in parts if part)
+
+
+def iter_markdown_files(directory):
+    """Yield markdown files of a Jekyll directory in sorted order"""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return
+    for path in sorted(directory.iterdir()):
+        if path.suffix in MARKDOWN_EXTENSIONS and path.is_file():
+            yield path
+
+
+def load_document(path, kind):
+    """Parse a post or project page into a flat document record"""
+    path = Path(path)
+    front_matter, body = split_front_matter(path.read_text(encoding="utf-8"))
+
+    if kind == "post":
+        url = post_url(path, front_matter)
+        published = post_date(path, front_matter)
+    else:
+        url = front_matter.get("github") or front_matter.get("live_url") or ""
+        published = front_matter.get("last_updated")
+
+    return {
+        "path": str(path),
+        "kind": kind,
+        "slug": post_slug(path) if kind == "post" else path.stem,
+        "title": str(front_matter.get("title") or path.stem),
+        "url": url,
+        "date": str(published) if published else None,
+        "description": str(front_matter.get("description") or ""),
+        "categories": as_list(front_matter.get("categories")),
+        "tags": as_list(front_matter.get("tags"))
+        + as_list(front_matter.get("technologies")),
+        "headings": extract_headings(body),
+        "body": body,
+        "text": markdown_to_text(body),
+    }
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Tests for activity_history.py"""
+
+import os
+import sys
+import unittest
+from datetime import date
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from activity_history import TRENDS_QUERY, ActivityHistory
+from analyze_repos import GitHubRepoAnalyzer
+
+
+class TestActivityHistory(unittest.TestCase):
+    def setUp(self):
+        self.history = ActivityHistory(":memory:")
+
+    def tearDown(self):
+        self.history.close()
+
+    def test_record_snapshot_replaces_same_day(self):
+        """Test that one snapshot is kept per repo and day"""
+        self.history.record_snapshot("user/repo", {"stars": 1}, date(2025, 1, 1))
+        self.history.record_snapshot("user/repo", {"stars": 2}, date(2025, 1, 1))
+        self.history.record_snapshot("user/repo", {"stars": 3}, date(2025, 1, 2))
+        self.assertEqual(self.history.count_snapshots(), 2)
+
+    def test_get_trends(self):
+        """Test velocity and commit trend over the window"""
+        self.history.record_snapshot("user/repo", {"stars": 10, "forks": 2, "recent_commits": 5}, date(2024, 11, 1))
+        self.history.record_snapshot("user/repo", {"stars": 20, "forks": 3, "recent_commits": 4}, date(2025, 1, 1))
+        self.history.record_snapshot("user/repo", {"stars": 30, "forks": 4, "recent_commits": 8}, date(2025, 1, 11))
+        self.history.record_snapshot("user/repo", {"stars": 40, "forks": 6, "recent_commits": 9}, date(2025, 1, 21))
+        self.history.record_snapshot("user/other", {"stars": 5}, date(2025, 1, 21))
+
+        trends = self.history.get_trends(window_days=30, as_of=date(2025, 1, 21))
+
+        trend = trends["user/repo"]
+        self.assertEqual(trend["days"], 20)
+        self.assertAlmostEqual(trend["star_velocity"], 1.0)
+        self.assertAlmostEqual(trend["fork_velocity"], 0.15)
+        self.assertEqual(trend["commit_trend"], 5)
+        self.assertEqual(trend["snapshots"], 3)
+
+        # A single snapshot has no trend yet
+        self.assertEqual(trends["user/other"]["days"], 0)
+        self.assertEqual(trends["user/other"]["star_velocity"], 0.0)
+
+        only = self.history.get_trends("user/other", as_of=date(2025, 1, 21))
+        self.assertEqual(list(only), ["user/other"])
+
+    def test_single_repo_trend_uses_primary_key(self):
+        """Test that a one-repository trend lookup is a primary key range search"""
+        query = TRENDS_QUERY.format(repo_filter="AND repo = :repo")
+        params = {"start": "2025-01-01", "end": "2025-01-31", "repo": "user/repo"}
+        plan = " ".join(
+            row[-1] for row in self.history.connection.execute("EXPLAIN QUERY PLAN " + query, params)
+        )
+        self.assertIn("SEARCH snapshots USING PRIMARY KEY", plan)
+        self.assertNotIn("SCAN snapshots", plan)
+
+    def test_trend_score(self):
+        """Test that trends add to the activity score"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+        self.assertEqual(analyzer.calculate_trend_score(None), 0)
+
+        trend = {"days": 20, "star_velocity": 1.0, "fork_velocity": 0.1, "commit_trend": 5, "snapshots": 3}
+        # 20 stars gained * 2 + 2 forks gained * 5 + 10 for rising commits
+        self.assertEqual(analyzer.calculate_trend_score(trend), 60)
+
+        repo = {'stargazers_count': 10, 'forks_count': 5, 'open_issues_count': 2, 'size': 1000, 'pushed_at': None}
+        self.assertEqual(analyzer.calculate_activity_score(repo, [], trend), 47 + 60)
+
+    def test_trend_score_short_span(self):
+        """Test that snapshots a day apart do not extrapolate a single star"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+        trend = {"days": 1, "star_velocity": 1.0, "fork_velocity": 0.0, "commit_trend": 1, "snapshots": 2}
+        self.assertEqual(analyzer.calculate_trend_score(trend), 0)
+
+        repo = {'stargazers_count': 4, 'forks_count': 0, 'open_issues_count': 0, 'size': 0, 'pushed_at': None}
+        score = analyzer.calculate_activity_score(repo, [], trend)
+        self.assertEqual(analyzer.get_activity_level(score, {'archived': False, 'disabled': False}), 'low')
+
+
+if __name__ == '__main__':
+    unittest.main()
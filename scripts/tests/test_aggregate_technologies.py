@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Tests for aggregate_technologies.py"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aggregate_technologies import TechnologyIndex
+
+
+def make_analysis(name, languages, topics, pushed_at='2025-01-01T00:00:00Z'):
+    return {
+        'full_name': f'user/{name}',
+        'languages': languages,
+        'topics': topics,
+        'pushed_at': pushed_at,
+    }
+
+
+class TestTechnologyIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.snapshot_path = Path(self.tmpdir.name) / 'snapshot.json'
+        self.analyses = [
+            make_analysis('metro', {'Python': 3000, 'Shell': 100}, ['simulation']),
+            make_analysis('june', {'Python': 1000, 'JavaScript': 900}, ['ai']),
+        ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_aggregates(self):
+        """Test account-wide totals and co-occurrence counts"""
+        index = TechnologyIndex(None)
+        self.assertEqual(index.update(self.analyses), (2, 0, 0))
+        data = index.generate_data()
+
+        self.assertEqual(data['repo_count'], 2)
+        self.assertEqual(data['total_bytes'], 5000)
+        self.assertEqual(data['languages'][0], {'name': 'Python', 'bytes': 4000, 'percentage': 80.0, 'repos': 2})
+        self.assertEqual([t['name'] for t in data['topics']], ['ai', 'simulation'])
+        pairs = {tuple(p['technologies']): p['repos'] for p in data['co_occurrence']}
+        self.assertEqual(pairs[('Python', 'Shell')], 1)
+        self.assertEqual(pairs[('JavaScript', 'Python')], 1)
+        self.assertEqual(pairs[('Python', 'simulation')], 1)
+
+    def test_incremental_update_matches_full_rebuild(self):
+        """Test that updating from a snapshot gives the same result as a rebuild"""
+        index = TechnologyIndex(self.snapshot_path)
+        index.update(self.analyses)
+        index.save_snapshot()
+
+        current = [
+            make_analysis('metro', {'Python': 3000, 'Shell': 100}, ['simulation']),
+            make_analysis('june', {'Python': 1500, 'TypeScript': 900}, ['ai', 'agents'], '2025-02-01T00:00:00Z'),
+            make_analysis('trouble', {'Go': 700}, ['cli']),
+        ]
+        incremental = TechnologyIndex(self.snapshot_path)
+        self.assertEqual(incremental.update(current), (1, 1, 0))
+
+        rebuilt = TechnologyIndex(None)
+        rebuilt.update(current)
+        self.assertEqual(incremental.generate_data(), rebuilt.generate_data())
+
+        self.assertEqual(incremental.update(current[:2]), (0, 0, 1))
+        self.assertNotIn('Go', [lang['name'] for lang in incremental.generate_data()['languages']])
+
+    def test_unpruned_update_keeps_missing_repos(self):
+        """Test that limited runs do not drop repositories they did not see"""
+        index = TechnologyIndex(None)
+        index.update(self.analyses)
+        self.assertEqual(index.update(self.analyses[:1], prune=False), (0, 0, 0))
+        self.assertEqual(index.generate_data()['repo_count'], 2)
+
+    def test_save_data(self):
+        """Test the technologies data file"""
+        index = TechnologyIndex(None)
+        index.update(self.analyses)
+        path = index.save_data(Path(self.tmpdir.name) / '_data' / 'technologies.json')
+        self.assertEqual(json.loads(path.read_text())['languages'][1]['name'], 'JavaScript')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@ import sys
 import os
 from unittest.mock import Mock, patch
 
+import yaml
+
 # Add the parent directory to the path so we can import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -131,5 +133,151 @@ class TestGitHubRepoAnalyzer(unittest.TestCase):
         self.assertIn('Python', frontmatter['technologies'])
         self.assertIn('python', frontmatter['technologies'])
 
+    def make_page_analysis(self, description):
+        return {
+            'name': 'test-project',
+            'description': description,
+            'url': 'https://github.com/user/test-project',
+            'homepage': 'https://example.com',
+            'activity_level': 'very_active',
+            'stars': 10,
+            'forks': 5,
+            'pushed_at': '2023-01-01T00:00:00Z',
+            'created_at': '2022-01-01T00:00:00Z',
+            'primary_language': 'Python',
+            'language_percentages': {'Shell': 5.0, 'Python': 80.0, 'JavaScript': 15.0},
+            'topics': ['python', 'web'],
+            'license': 'MIT',
+            'archived': False
+        }
+
+    def test_generate_project_content(self):
+        """Test project page content rendering"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+        content = analyzer.generate_project_content(self.make_page_analysis('A test project'))
+
+        self.assertTrue(content.startswith('## Test Project\n\nA test project\n\n**Status:** 🔥 Very Active\n\n'))
+        self.assertIn('- **License:** MIT\n- **Created:** 2022-01-01\n- **Last Updated:** 2023-01-01\n', content)
+        self.assertIn('## Language Breakdown\n\n- **Python:** 80.0%\n- **JavaScript:** 15.0%\n- **Shell:** 5.0%\n', content)
+        self.assertIn('## Topics\n\n`python` `web` \n', content)
+        self.assertTrue(content.endswith('- [View on GitHub](https://github.com/user/test-project)\n- [Live Demo](https://example.com)\n'))
+
+    def test_sorted_languages_computed_once(self):
+        """Test that the language ranking is cached on the analysis"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+        analysis = self.make_page_analysis('A test project')
+        ranked = analyzer.get_sorted_languages(analysis)
+        self.assertEqual([lang for lang, _ in ranked], ['Python', 'JavaScript', 'Shell'])
+        self.assertIs(analyzer.get_sorted_languages(analysis), ranked)
+
+    def test_dump_frontmatter_matches_pure_python_emitter(self):
+        """Test that frontmatter YAML is identical to yaml.Dumper output"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+        descriptions = [
+            'A test project: with "quotes" and a #hash',
+            'Unicode é 🔥 text that is long enough to be folded across several lines by the emitter',
+            'yes',
+        ]
+        for description in descriptions:
+            frontmatter = analyzer.generate_project_frontmatter(self.make_page_analysis(description))
+            expected = yaml.dump(frontmatter, Dumper=yaml.Dumper, default_flow_style=False, sort_keys=False)
+            self.assertEqual(analyzer.dump_frontmatter(frontmatter), expected)
+
+    def test_estimate_requests(self):
+        """Test per-endpoint request estimates"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+
+        estimate = analyzer.estimate_requests(150)
+        self.assertEqual(estimate, {'repos': 2, 'languages': 150, 'commits': 150, 'readme': 150})
+
+        # A full last listing page needs one more (empty) page to stop
+        self.assertEqual(analyzer.estimate_requests(100)['repos'], 2)
+        self.assertEqual(analyzer.estimate_requests(100, listing_cached=True)['repos'], 0)
+
+        # --limit analyzes fewer repositories, but the whole listing is fetched
+        estimate = analyzer.estimate_requests(50, listing_count=250)
+        self.assertEqual(estimate['repos'], 3)
+        self.assertEqual(estimate['languages'], 50)
+
+    def test_get_rate_limit(self):
+        """Test rate limit parsing"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+        response = Mock()
+        response.json.return_value = {
+            'resources': {'core': {'limit': 60, 'remaining': 42, 'reset': 1700000000, 'used': 18}}
+        }
+        with patch.object(analyzer.session, 'get', return_value=response) as get:
+            rate_limit = analyzer.get_rate_limit()
+        get.assert_called_once_with('https://api.github.com/rate_limit')
+        self.assertEqual(rate_limit, {'limit': 60, 'remaining': 42, 'reset': 1700000000})
+
+    def test_build_execution_plan(self):
+        """Test that the plan splits repositories at the rate-limit budget"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+        repos = [{'name': f'repo-{i}'} for i in range(10)]
+
+        rate_limit = {'limit': 60, 'remaining': 30, 'reset': 1700000000}
+        plan = analyzer.build_execution_plan(repos, rate_limit, reserve=5)
+
+        # 1 listing request + 3 per repository, within 25 requests
+        self.assertEqual(plan['total_requests'], 31)
+        self.assertFalse(plan['fits_in_budget'])
+        self.assertEqual(plan['repositories_in_budget'], 8)
+        self.assertEqual(plan['over_budget_repositories'], ['repo-8', 'repo-9'])
+        self.assertEqual(plan['steps'][0], {'step': 'list repositories', 'requests': 1, 'cumulative': 1})
+        self.assertEqual(plan['steps'][-1]['cumulative'], 31)
+
+        plan = analyzer.build_execution_plan(repos, {'limit': 5000, 'remaining': 5000, 'reset': 0}, listing_cached=True)
+        self.assertTrue(plan['fits_in_budget'])
+        self.assertEqual(plan['requests_by_endpoint']['repos'], 0)
+        self.assertEqual(plan['over_budget_repositories'], [])
+
+    def test_generate_projects_data(self):
+        """Test grouped projects data generation"""
+        analyzer = GitHubRepoAnalyzer("testuser")
+
+        def make_analysis(name, score, level):
+            return {
+                'name': name,
+                'description': f'{name} description',
+                'url': f'https://github.com/user/{name}',
+                'homepage': None,
+                'activity_level': level,
+                'activity_score': score,
+                'stars': 1,
+                'forks': 0,
+                'pushed_at': '2023-01-01T00:00:00Z',
+                'created_at': '2022-01-01T00:00:00Z',
+                'primary_language': 'Python',
+                'language_percentages': {'Python': 90.0, 'Shell': 10.0},
+                'topics': [],
+                'license': None,
+                'archived': False
+            }
+
+        analyses = [
+            make_analysis('low-one', 40, 'active'),
+            make_analysis('high-one', 90, 'active'),
+            make_analysis('sleepy', 1, 'idle'),
+        ]
+
+        data = analyzer.generate_projects_data(analyses)
+
+        self.assertEqual(data['total'], 3)
+        levels = [group['level'] for group in data['groups']]
+        self.assertEqual(levels, ['very_active', 'active', 'moderate', 'low', 'idle', 'archived'])
+
+        active = data['groups'][1]
+        self.assertEqual(active['count'], 2)
+        self.assertEqual([p['name'] for p in active['projects']], ['high-one', 'low-one'])
+        self.assertEqual(active['projects'][0]['technologies'], 'Python, Shell')
+        self.assertEqual(active['projects'][0]['title'], 'High One')
+        self.assertEqual(data['groups'][0]['projects'], [])
+
+        # The statistics list keeps its own wording
+        low = data['groups'][levels.index('low')]
+        self.assertEqual((low['label'], low['stats_label']), ('Low', 'Low Activity'))
+        self.assertEqual(data['groups'][4]['count'], 1)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Tests for build_search_index.py"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from build_search_index import SearchIndexBuilder
+from site_content import tokenize
+
+
+def make_document(title, text, tags=None):
+    return {
+        'title': title,
+        'url': f"/{title.lower()}.html",
+        'kind': 'post',
+        'date': '2025-01-15',
+        'description': '',
+        'tags': tags or [],
+        'headings': [],
+        'text': text,
+    }
+
+
+class TestSearchIndexBuilder(unittest.TestCase):
+    def test_tokenize(self):
+        """Test tokenization drops stop words and single characters"""
+        self.assertEqual(tokenize('The Pygame 2D platformer, a game!'), ['pygame', '2d', 'platformer', 'game'])
+
+    def test_postings_are_weighted(self):
+        """Test that title matches outrank body matches"""
+        builder = SearchIndexBuilder()
+        body_id = builder.add_document(make_document('Metro', 'a python simulation'))
+        title_id = builder.add_document(make_document('Python', 'something else'))
+
+        shards = builder.build_shards()
+        shard = shards['p']
+        postings = shard['postings'][shard['terms'].index('python')]
+        self.assertEqual(postings, [title_id, 10, body_id, 1])
+
+    def test_shards_are_sorted_by_prefix(self):
+        """Test that shard terms are sorted so prefix matches are contiguous"""
+        builder = SearchIndexBuilder(prefix_length=2)
+        builder.add_document(make_document('Doc', 'simulation simple single', tags=['sim']))
+        shard = builder.build_shards()['si']
+        self.assertEqual(shard['terms'], ['sim', 'simple', 'simulation', 'single'])
+
+    def test_write(self):
+        """Test the emitted manifest, docs table and shard files"""
+        builder = SearchIndexBuilder()
+        builder.add_document(make_document('Metro', 'python simulation'))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir)
+            (output / 'terms-z.json').write_text('{}')
+            manifest = builder.write(output)
+
+            self.assertEqual(manifest['doc_count'], 1)
+            self.assertEqual(sorted(manifest['shards']), ['m', 'p', 's'])
+            self.assertFalse((output / 'terms-z.json').exists())
+
+            docs = json.loads((output / 'docs.json').read_text())
+            self.assertEqual(docs[0]['u'], '/metro.html')
+            shard = json.loads((output / manifest['shards']['s']).read_text())
+            self.assertEqual(shard['terms'], ['simulation'])
+
+
+if __name__ == '__main__':
+    unittest.main()
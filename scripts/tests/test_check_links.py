@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Tests for check_links.py"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from check_links import LinkChecker, collect_links, extract_links
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Local HTTP stand-in for external sites"""
+
+    requests_seen = []
+
+    def _respond(self, send_body):
+        self.requests_seen.append((self.command, self.path))
+        if self.path == "/ok":
+            status = 200
+        elif self.path == "/no-head":
+            status = 405 if self.command == "HEAD" else 200
+        elif self.path == "/moved":
+            self.send_response(301)
+            self.send_header("Location", "/ok")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        else:
+            status = 404
+        body = b"stand-in"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestLinkExtraction(unittest.TestCase):
+    def test_extract_links(self):
+        """Test links from front matter, markdown, autolinks and HTML"""
+        text = (
+            "---\n"
+            "title: Demo\n"
+            "github: https://github.com/user/demo\n"
+            "live_url: null\n"
+            "---\n\n"
+            "![Shot]({{ '/assets/images/blog/demo.png' | relative_url }})\n"
+            "See [docs](https://example.com/docs \"Docs\") and <https://example.org>.\n"
+            "<a href=\"https://example.net/x\">x</a> and [again](https://example.com/docs)\n"
+        )
+        self.assertEqual(
+            extract_links(text),
+            [
+                "https://github.com/user/demo",
+                "https://example.com/docs",
+                "https://example.org",
+                "https://example.net/x",
+            ],
+        )
+
+    def test_collect_links_deduplicates_across_pages(self):
+        """Test that a link used on several pages is checked once"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "a.md"
+            second = Path(tmpdir) / "b.md"
+            first.write_text("[x](https://example.com/a)")
+            second.write_text("[y](https://example.com/a) [z](https://example.com/b)")
+            pages = collect_links([first, second])
+
+        self.assertEqual(sorted(pages), ["https://example.com/a", "https://example.com/b"])
+        self.assertEqual(len(pages["https://example.com/a"]), 2)
+
+
+class TestLinkChecker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StandInHandler.requests_seen = []
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmpdir.name) / "links.json"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_check_statuses(self):
+        """Test HEAD success, GET fallback, redirects and broken links"""
+        checker = LinkChecker(self.cache_path, timeout=5)
+        urls = [f"{self.base}/ok", f"{self.base}/no-head", f"{self.base}/moved", f"{self.base}/gone"]
+        results, checked = checker.check(urls)
+
+        self.assertEqual(checked, 4)
+        self.assertEqual(results[f"{self.base}/ok"]["method"], "HEAD")
+        self.assertTrue(results[f"{self.base}/ok"]["ok"])
+        self.assertTrue(results[f"{self.base}/no-head"]["ok"])
+        self.assertEqual(results[f"{self.base}/no-head"]["method"], "GET")
+        self.assertEqual(results[f"{self.base}/moved"]["status"], 200)
+        self.assertFalse(results[f"{self.base}/gone"]["ok"])
+        self.assertEqual(results[f"{self.base}/gone"]["status"], 404)
+
+    def test_cache_skips_fresh_results(self):
+        """Test that reruns only check new, expired or failed URLs"""
+        checker = LinkChecker(self.cache_path, timeout=5)
+        checker.check([f"{self.base}/ok", f"{self.base}/gone"])
+        checker.save_cache()
+
+        StandInHandler.requests_seen = []
+        checker = LinkChecker(self.cache_path, timeout=5)
+        results, checked = checker.check([f"{self.base}/ok", f"{self.base}/gone", f"{self.base}/no-head"])
+        self.assertEqual(checked, 2)
+        self.assertNotIn(("HEAD", "/ok"), StandInHandler.requests_seen)
+        self.assertTrue(results[f"{self.base}/ok"]["ok"])
+
+        checker.cache[f"{self.base}/ok"]["checked_at"] = time.time() - 2 * 3600
+        expired = LinkChecker(None, ttl_hours=1, timeout=5)
+        expired.cache = checker.cache
+        _, checked = expired.check([f"{self.base}/ok"])
+        self.assertEqual(checked, 1)
+
+    def test_connection_errors_are_broken(self):
+        """Test that unreachable hosts are reported with an error"""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        port = server.server_address[1]
+        server.server_close()
+
+        results, _ = LinkChecker(None, timeout=2).check([f"http://127.0.0.1:{port}/ok"])
+        result = results[f"http://127.0.0.1:{port}/ok"]
+        self.assertFalse(result["ok"])
+        self.assertIsNone(result["status"])
+        self.assertTrue(result["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Tests for image_cache.py"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_cache import ImageCache, prompt_key
+
+SETTINGS = {"generator": "midjourney_mcp"}
+
+
+class TestImageCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmpdir.name) / "cache"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_prompt_key(self):
+        """Test that the key covers prompt, aspect ratio and settings"""
+        key = prompt_key("a glider", "1:1", SETTINGS)
+        self.assertEqual(key, prompt_key("a glider", "1:1", dict(SETTINGS)))
+        self.assertNotEqual(key, prompt_key("a glider", "16:9", SETTINGS))
+        self.assertNotEqual(key, prompt_key("a glider!", "1:1", SETTINGS))
+        self.assertNotEqual(key, prompt_key("a glider", "1:1", {"generator": "other"}))
+
+    def test_put_get_persists(self):
+        """Test that results survive a reload of the cache"""
+        cache = ImageCache(self.cache_dir)
+        self.assertIsNone(cache.get("a glider", "1:1", SETTINGS))
+
+        cache.put("glider.png", "a glider", "1:1", "https://cdn/glider.png", SETTINGS)
+        cache.save()
+
+        reloaded = ImageCache(self.cache_dir)
+        entry = reloaded.get("a glider", "1:1", SETTINGS)
+        self.assertEqual(entry["result"], "https://cdn/glider.png")
+        self.assertEqual(entry["filename"], "glider.png")
+
+    def test_errors_are_not_cached(self):
+        """Test that failed generations are retried next run"""
+        cache = ImageCache(self.cache_dir)
+        entry = cache.put(
+            "glider.png", "a glider", "1:1", "Error: Failed to get websocket token"
+        )
+        self.assertIsNone(entry)
+        self.assertEqual(cache.entries, {})
+
+    def test_artifact_round_trip(self):
+        """Test that image artifacts are stored and restored"""
+        source = Path(self.tmpdir.name) / "generated.png"
+        source.write_bytes(b"\x89PNG fake image")
+
+        cache = ImageCache(self.cache_dir)
+        entry = cache.put(
+            "glider.png", "a glider", "1:1", str(source), SETTINGS, source
+        )
+        self.assertIsNotNone(entry["artifact"])
+
+        destination = Path(self.tmpdir.name) / "out" / "glider.png"
+        self.assertTrue(cache.restore_artifact(entry, destination))
+        self.assertEqual(destination.read_bytes(), b"\x89PNG fake image")
+
+    def test_evict(self):
+        """Test eviction by filename, key prefix and age"""
+        cache = ImageCache(self.cache_dir)
+        old = cache.put("old.png", "old prompt", "1:1", "old-result")
+        old["created_at"] = time.time() - 10 * 86400
+        new = cache.put("new.png", "new prompt", "16:9", "new-result")
+        cache.put("other.png", "other prompt", "16:9", "other-result")
+
+        evicted = cache.evict(older_than_days=5)
+        self.assertEqual([e["filename"] for e in evicted], ["old.png"])
+
+        evicted = cache.evict(key=new["key"][:8])
+        self.assertEqual([e["filename"] for e in evicted], ["new.png"])
+
+        evicted = cache.evict(filename="other.png")
+        self.assertEqual(len(evicted), 1)
+        self.assertEqual(cache.list_entries(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Tests for index_posts.py"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import index_posts
+from index_posts import PostIndexer
+
+POST_TEMPLATE = """---
+title: "{title}"
+date: {date} 12:00:00 -0500
+categories: [{categories}]
+tags: [{tags}]
+---
+
+{body}
+"""
+
+
+def write_post(directory, date, slug, title, categories, tags, body):
+    path = Path(directory) / f"{date}-{slug}.md"
+    path.write_text(POST_TEMPLATE.format(
+        title=title, date=date, categories=categories, tags=tags, body=body
+    ))
+    return path
+
+
+class TestPostIndexer(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.posts_dir = Path(self.tmpdir.name) / "_posts"
+        self.posts_dir.mkdir()
+        self.paths = [
+            write_post(self.posts_dir, "2025-01-10", "pygame-platformer", "Pygame Platformer",
+                       "projects, games", "pygame, python", "Sprites and physics for a pygame platformer."),
+            write_post(self.posts_dir, "2025-01-12", "pygame-sprites", "Procedural Sprites",
+                       "projects, games", "pygame", "Generating pygame sprites procedurally."),
+            write_post(self.posts_dir, "2025-01-14", "city-simulation", "City Simulation",
+                       "projects, simulation", "python, matplotlib", "Zoning roads and demographics."),
+        ]
+        self.cache_path = Path(self.tmpdir.name) / "cache.json"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_parse_posts_skips_unchanged(self):
+        """Test that unchanged posts are not re-parsed on the next run"""
+        indexer = PostIndexer(self.cache_path, workers=2)
+        posts, parsed = indexer.parse_posts(self.paths)
+        self.assertEqual(parsed, 3)
+        self.assertEqual([p["slug"] for p in posts],
+                         ["pygame-platformer", "pygame-sprites", "city-simulation"])
+        indexer.save_cache()
+
+        indexer = PostIndexer(self.cache_path)
+        posts, parsed = indexer.parse_posts(self.paths)
+        self.assertEqual(parsed, 0)
+        self.assertEqual(len(posts), 3)
+
+        write_post(self.posts_dir, "2025-01-14", "city-simulation", "City Simulation v2",
+                   "projects", "python", "Updated and a bit longer body text.")
+        posts, parsed = indexer.parse_posts(self.paths)
+        self.assertEqual(parsed, 1)
+        self.assertEqual(posts[2]["title"], "City Simulation v2")
+
+    def test_config_change_drops_cache(self):
+        """Test that editing the site config re-parses every post"""
+        config_path = Path(self.tmpdir.name) / "_config.yml"
+        config_path.write_text("timezone: America/New_York\n")
+
+        indexer = PostIndexer(self.cache_path, config_path=config_path)
+        indexer.parse_posts(self.paths)
+        indexer.save_cache()
+
+        _, parsed = PostIndexer(self.cache_path, config_path=config_path).parse_posts(self.paths)
+        self.assertEqual(parsed, 0)
+
+        config_path.write_text("timezone: UTC\n")
+        _, parsed = PostIndexer(self.cache_path, config_path=config_path).parse_posts(self.paths)
+        self.assertEqual(parsed, 3)
+
+    def test_label_index(self):
+        """Test tag index lists posts newest first"""
+        posts, _ = PostIndexer().parse_posts(self.paths)
+        tags = PostIndexer.build_label_index(posts, "tags")
+        self.assertEqual(sorted(tags), ["matplotlib", "pygame", "python"])
+        self.assertEqual([p["title"] for p in tags["pygame"]],
+                         ["Procedural Sprites", "Pygame Platformer"])
+        self.assertEqual(tags["python"][0]["url"],
+                         "/projects/simulation/2025/01/14/city-simulation.html")
+
+    def test_related_posts(self):
+        """Test related posts rank the most similar post first"""
+        posts, _ = PostIndexer().parse_posts(self.paths)
+        related = PostIndexer().build_related_posts(posts, top_k=1)
+        self.assertEqual(related["pygame-platformer"][0]["title"], "Procedural Sprites")
+        self.assertEqual(len(related["city-simulation"]), 1)
+
+    def test_similarity_without_numpy(self):
+        """Test that the pure Python fallback matches the vectorized result"""
+        posts, _ = PostIndexer().parse_posts(self.paths)
+        expected = PostIndexer.similarity_matrix(posts)
+        with patch.object(index_posts, "np", None):
+            fallback = PostIndexer.similarity_matrix(posts)
+        for row, fallback_row in zip(expected, fallback):
+            for value, fallback_value in zip(row, fallback_row):
+                self.assertAlmostEqual(value, fallback_value, places=6)
+
+    def test_write_data_files(self):
+        """Test the data files written for the layouts"""
+        indexer = PostIndexer()
+        posts, _ = indexer.parse_posts(self.paths)
+        data_dir = Path(self.tmpdir.name) / "_data"
+        indexer.write_data_files(posts, data_dir)
+
+        categories = json.loads((data_dir / "categories.json").read_text())
+        self.assertEqual(len(categories["projects"]), 3)
+        related = json.loads((data_dir / "related_posts.json").read_text())
+        self.assertEqual(set(related), {"pygame-platformer", "pygame-sprites", "city-simulation"})
+
+
+if __name__ == '__main__':
+    unittest.main()
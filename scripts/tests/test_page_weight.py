@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for page_weight.py"""
+
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_weight import PageWeightAnalyzer, budget_for_page, check_budget, load_budget
+
+PAGE = """<html><head>
+<link rel="stylesheet" href="/assets/main.css?v=2">
+<link rel="alternate" type="application/rss+xml" href="/feed.xml">
+<script src="https://example.com/analytics.js"></script>
+</head><body>
+<img src="../assets/photo.png" srcset="/assets/photo.png 1x, /assets/photo@2x.png 2x">
+<img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=">
+<img src="/assets/missing.png">
+</body></html>"""
+
+
+class TestPageWeight(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.site = Path(self.tmpdir.name) / "_site"
+        (self.site / "assets").mkdir(parents=True)
+        (self.site / "blog").mkdir()
+        (self.site / "blog" / "index.html").write_text(PAGE)
+        (self.site / "index.html").write_text("<html><body>Home</body></html>")
+        (self.site / "assets" / "main.css").write_text(
+            "body { background: url('bg.jpg'); }\n" * 50
+        )
+        (self.site / "assets" / "bg.jpg").write_bytes(b"\xff" * 3000)
+        (self.site / "assets" / "photo.png").write_bytes(b"\x89PNG" * 1000)
+        (self.site / "assets" / "photo@2x.png").write_bytes(b"\x89PNG" * 2000)
+        self.analyzer = PageWeightAnalyzer(self.site)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_resolves_local_assets(self):
+        """Test that pages count their local assets, including CSS url() references"""
+        page = self.analyzer.analyze_page(self.site / "blog" / "index.html")
+
+        self.assertEqual(page["page"], "blog/index.html")
+        # srcset candidates are alternatives to src, not extra downloads
+        self.assertEqual(page["requests"], 4)
+        self.assertEqual(page["missing_assets"], ["/assets/missing.png"])
+        self.assertEqual(
+            [asset["path"] for asset in page["heaviest_assets"]],
+            ["assets/photo.png", "assets/bg.jpg", "assets/main.css"],
+        )
+        self.assertEqual(page["largest_asset_bytes"], 4000)
+
+    def test_counts_one_image_per_picture(self):
+        """Test that a picture and a srcset-only image each count one candidate"""
+        (self.site / "index.html").write_text(
+            "<picture>"
+            '<source srcset="/assets/photo@2x.png 2x, /assets/photo.png 1x">'
+            '<img src="/assets/bg.jpg">'
+            "</picture>"
+            "<picture>"
+            '<source srcset="/assets/photo@2x.png 2x">'
+            "<img>"
+            "</picture>"
+            '<img srcset="/assets/photo.png 1x, /assets/photo@2x.png 2x">'
+        )
+        page = self.analyzer.analyze_page(self.site / "index.html")
+        self.assertEqual(
+            sorted(asset["path"] for asset in page["heaviest_assets"]),
+            ["assets/bg.jpg", "assets/photo.png", "assets/photo@2x.png"],
+        )
+        self.assertEqual(page["requests"], 4)
+
+    def test_compressed_sizes(self):
+        """Test that text is measured compressed and images as they are"""
+        css = self.site / "assets" / "main.css"
+        raw, compressed = self.analyzer.asset_sizes(css)
+        self.assertEqual(raw, css.stat().st_size)
+        self.assertEqual(
+            compressed, len(gzip.compress(css.read_bytes(), compresslevel=9))
+        )
+        self.assertEqual(
+            self.analyzer.asset_sizes(self.site / "assets" / "bg.jpg"), (3000, 3000)
+        )
+
+        # An existing precompressed sibling is what the server sends
+        html = self.site / "index.html"
+        html.with_name("index.html.gz").write_bytes(b"x" * 5)
+        self.assertEqual(PageWeightAnalyzer(self.site).asset_sizes(html)[1], 5)
+
+    def test_baseurl(self):
+        """Test that the site baseurl is stripped from root-relative URLs"""
+        (self.site / "index.html").write_text('<img src="/blog-site/assets/bg.jpg">')
+        analyzer = PageWeightAnalyzer(self.site, baseurl="/blog-site")
+        page = analyzer.analyze_page(self.site / "index.html")
+        self.assertEqual(page["missing_assets"], [])
+        self.assertEqual(page["requests"], 2)
+
+    def test_analyze_site(self):
+        """Test that the site report lists pages heaviest first"""
+        report = self.analyzer.analyze_site(top_assets=2)
+        self.assertEqual(
+            [page["page"] for page in report["pages"]],
+            ["blog/index.html", "index.html"],
+        )
+        self.assertEqual(
+            [asset["path"] for asset in report["heaviest_assets"]],
+            ["assets/photo.png", "assets/bg.jpg"],
+        )
+
+    def test_budget(self):
+        """Test default budgets, per-page overrides and violations"""
+        budget_path = Path(self.tmpdir.name) / "budget.yml"
+        budget_path.write_text(
+            "default:\n"
+            "  max_requests: 10\n"
+            "  max_asset_bytes: 3500\n"
+            "pages:\n"
+            '  "blog/*":\n'
+            "    max_requests: 3\n"
+        )
+        budget = load_budget(budget_path)
+        self.assertEqual(
+            budget_for_page(budget, "blog/index.html"),
+            {"max_requests": 3, "max_asset_bytes": 3500},
+        )
+
+        violations = check_budget(self.analyzer.analyze_site(), budget)
+        self.assertEqual(
+            sorted((v["page"], v["budget"], v["actual"]) for v in violations),
+            [
+                ("blog/index.html", "max_asset_bytes", 4000),
+                ("blog/index.html", "max_requests", 4),
+            ],
+        )
+
+        budget_path.write_text("default:\n  max_weight: 1\n")
+        with self.assertRaises(ValueError):
+            load_budget(budget_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for precompress_site.py"""
+
+import gzip
+import os
+import sys
+import tempfile
+import types
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from precompress_site import SitePrecompressor, compress_file
+
+PAGE = ("<html><body>" + "<p>Sugar gliders love strawberries.</p>" * 200 + "</body></html>").encode()
+
+
+class TestPrecompressSite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.site = Path(self.tmpdir.name) / "_site"
+        (self.site / "assets" / "css").mkdir(parents=True)
+        (self.site / "index.html").write_bytes(PAGE)
+        (self.site / "assets" / "css" / "style.css").write_bytes(b"body { margin: 0; }\n" * 100)
+        (self.site / "tiny.json").write_bytes(b"{}")
+        (self.site / "logo.png").write_bytes(b"\x89PNG" * 200)
+        self.manifest = Path(self.tmpdir.name) / "manifest.json"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_writes_gzip_siblings(self):
+        """Test that compressible assets get maximum-level .gz siblings"""
+        precompressor = SitePrecompressor(self.site, self.manifest, workers=2)
+        results = precompressor.run(use_brotli=False)
+
+        self.assertEqual(
+            sorted(Path(r["path"]).name for r in results), ["index.html", "style.css"]
+        )
+        self.assertEqual(gzip.decompress((self.site / "index.html.gz").read_bytes()), PAGE)
+        self.assertTrue((self.site / "assets" / "css" / "style.css.gz").exists())
+        self.assertFalse((self.site / "tiny.json.gz").exists())
+        self.assertFalse((self.site / "logo.png.gz").exists())
+
+        summary = SitePrecompressor.summarize(results)
+        self.assertEqual(summary[".html"]["files"], 1)
+        self.assertLess(summary[".html"][".gz"], summary[".html"]["bytes"])
+
+    def test_skips_fresh_files(self):
+        """Test that a rerun skips files whose siblings match their content"""
+        precompressor = SitePrecompressor(self.site, self.manifest, workers=1)
+        precompressor.run(use_brotli=False)
+        precompressor.save_manifest()
+
+        results = SitePrecompressor(self.site, self.manifest, workers=1).run(use_brotli=False)
+        self.assertFalse(any(r["written"] for r in results))
+
+        # Changed content is recompressed
+        changed = PAGE.replace(b"strawberries", b"figs")
+        (self.site / "index.html").write_bytes(changed)
+        results = SitePrecompressor(self.site, self.manifest, workers=1).run(use_brotli=False)
+        written = [Path(r["path"]).name for r in results if r["written"]]
+        self.assertEqual(written, ["index.html"])
+        self.assertEqual(gzip.decompress((self.site / "index.html.gz").read_bytes()), changed)
+
+    def test_rebuild_recompresses(self):
+        """Test that siblings removed by a Jekyll rebuild are written again"""
+        precompressor = SitePrecompressor(self.site, self.manifest, workers=1)
+        precompressor.run(use_brotli=False)
+        precompressor.save_manifest()
+
+        # Jekyll's cleaner deletes files it did not generate, and rewrites the rest
+        for sibling in self.site.rglob("*.gz"):
+            sibling.unlink()
+        (self.site / "index.html").write_bytes(PAGE)
+
+        results = SitePrecompressor(self.site, self.manifest, workers=1).run(use_brotli=False)
+        self.assertTrue(all(r["written"] for r in results))
+        self.assertEqual(gzip.decompress((self.site / "index.html.gz").read_bytes()), PAGE)
+
+    def test_encoder_toggle_does_not_keep_stale_siblings(self):
+        """Test that skipping Brotli for a run does not leave an old .br marked fresh"""
+        fake_brotli = types.SimpleNamespace(
+            compress=lambda data, quality: b"br:" + zlib.compress(data)
+        )
+        path = self.site / "index.html"
+        changed = PAGE.replace(b"strawberries", b"figs")
+
+        with mock.patch("precompress_site.brotli", fake_brotli):
+            first = compress_file(path)
+            path.write_bytes(changed)
+            second = compress_file(path, first["siblings"], use_brotli=False)
+            self.assertFalse(path.with_name("index.html.br").exists())
+            third = compress_file(path, second["siblings"])
+
+        self.assertNotIn(".br", second["siblings"])
+        self.assertIn(".br", third["siblings"])
+        br = path.with_name("index.html.br").read_bytes()
+        self.assertEqual(zlib.decompress(br[3:]), changed)
+
+    def test_removes_orphaned_siblings(self):
+        """Test that siblings of deleted or uncompressed pages are removed"""
+        SitePrecompressor(self.site, self.manifest, workers=1).run(use_brotli=False)
+        (self.site / "index.html").unlink()
+        (self.site / "release.tar.gz").write_bytes(b"archive")
+
+        SitePrecompressor(self.site, self.manifest, workers=1).run(use_brotli=False)
+        self.assertFalse((self.site / "index.html.gz").exists())
+        self.assertTrue((self.site / "assets" / "css" / "style.css.gz").exists())
+        self.assertTrue((self.site / "release.tar.gz").exists())
+
+    def test_incompressible_file_has_no_sibling(self):
+        """Test that a sibling is not kept when compression does not help"""
+        path = self.site / "random.txt"
+        path.write_bytes(os.urandom(1024))
+        result = compress_file(path, use_brotli=False)
+        self.assertFalse(result["written"])
+        self.assertFalse(path.with_name("random.txt.gz").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
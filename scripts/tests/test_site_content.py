@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for site_content.py"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zoneinfo import ZoneInfo
+
+from site_content import (
+    load_document,
+    markdown_to_text,
+    post_date,
+    post_url,
+    site_timezone,
+    split_front_matter,
+)
+
+POST = """---
+layout: post
+title: "Metro - A Simulation Framework"
+date: 2025-01-15 13:00:00 -0500
+categories: [projects, python]
+tags: [simulation, matplotlib]
+---
+
+![Metro]({{ '/assets/images/blog/metro.png' | relative_url }})
+
+## Why **Metro**?
+
+Cities are [complex](https://example.com) systems.
+"""
+
+
+class TestSiteContent(unittest.TestCase):
+    def test_split_front_matter(self):
+        """Test front matter parsing"""
+        front_matter, body = split_front_matter(POST)
+        self.assertEqual(front_matter['title'], 'Metro - A Simulation Framework')
+        self.assertEqual(front_matter['tags'], ['simulation', 'matplotlib'])
+        self.assertTrue(body.lstrip().startswith('![Metro]'))
+
+        self.assertEqual(split_front_matter('no front matter'), ({}, 'no front matter'))
+
+    def test_markdown_to_text(self):
+        """Test markdown and liquid stripping"""
+        text = markdown_to_text("## Why **Metro**?\n\nSee [docs](http://x) {{ site.url }}")
+        self.assertEqual(text, 'Why Metro ? See docs')
+
+    def test_post_url(self):
+        """Test Jekyll default post permalinks"""
+        path = Path('2025-01-15-metro-simulation.md')
+        front_matter, _ = split_front_matter(POST)
+        self.assertEqual(
+            post_url(path, front_matter),
+            '/projects/python/2025/01/15/metro-simulation.html'
+        )
+        self.assertEqual(post_url(path, {'permalink': '/metro/'}), '/metro/')
+
+    def test_post_date_site_timezone(self):
+        """Test that UTC dates near midnight take the day in the site timezone"""
+        path = Path('2024-04-12-welcome-to-jekyll.markdown')
+        front_matter = {
+            'date': '2024-04-12 02:23:43 +0000',
+            'categories': ['personal', 'website'],
+        }
+        new_york = ZoneInfo('America/New_York')
+
+        self.assertEqual(post_date(path, front_matter, new_york), '2024-04-11')
+        self.assertEqual(
+            post_url(path, front_matter, new_york),
+            '/personal/website/2024/04/11/welcome-to-jekyll.html'
+        )
+        self.assertEqual(post_date(path, front_matter, ZoneInfo('UTC')), '2024-04-12')
+        # Dates without an offset are already in the site timezone
+        self.assertEqual(post_date(path, {'date': '2024-04-12 02:23:43'}, new_york), '2024-04-12')
+
+    def test_site_timezone(self):
+        """Test reading the timezone from the site config"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Path(tmpdir) / '_config.yml'
+            config.write_text('title: Blog\ntimezone: America/New_York\n')
+            self.assertEqual(site_timezone(config), ZoneInfo('America/New_York'))
+            self.assertIsNone(site_timezone(Path(tmpdir) / 'missing.yml'))
+
+    def test_load_document(self):
+        """Test loading a post into a document record"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / '2025-01-15-metro-simulation.md'
+            path.write_text(POST)
+            document = load_document(path, 'post')
+
+        self.assertEqual(document['slug'], 'metro-simulation')
+        self.assertEqual(document['date'], '2025-01-15')
+        self.assertEqual(document['headings'], ['Why Metro ?'])
+        self.assertEqual(document['categories'], ['projects', 'python'])
+        self.assertIn('Cities are complex systems.', document['text'])
+
+
+if __name__ == '__main__':
+    unittest.main()